@@ -24,7 +24,7 @@ from moo.logging_config import get_logger, setup_logging
 setup_logging(mode="console")
 
 # Import after logging setup to avoid circular dependencies
-from src.moo.broker import Broker  # noqa: E402
+from src.moo.broker import Broker, ChannelOutput  # noqa: E402
 from src.moo.core.player import Player  # noqa: E402
 from src.moo.core.world import World  # noqa: E402
 
@@ -42,16 +42,13 @@ app.config["SECRET_KEY"] = "JGS123#"
 broker = Broker()
 
 
-class SocketOutput:
+class SocketOutput(ChannelOutput):
+    """Output for a web player, published to their websocket through the broker."""
+
     def __init__(self, player_name):
+        super().__init__(broker, player_name)
         self.player_name = player_name
 
-    def write(self, message):
-        asyncio.create_task(broker.publish(self.player_name, message))
-
-    def flush(self):
-        pass
-
 
 async def _receive() -> None:
     while True:
@@ -60,7 +57,12 @@ async def _receive() -> None:
         player = world.find_player(player_name)
         if player and message:
             logger.debug("WebSocket message from %s: %s", player_name, message)
-            world.parse_command(player, message)
+            world.scheduler.submit(player, message)
+
+
+@app.before_serving
+async def start_autosave() -> None:
+    world.start_autosave()
 
 
 @app.websocket("/ws")
@@ -0,0 +1,72 @@
+"""Benchmark Room.announce to a room full of telnet listeners.
+
+Usage: python benchmarks/bench_announce.py [listeners]
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.moo.core.player import Player
+from src.moo.core.world import World
+from src.moo.server import OutputBatch, StreamWriterWrapper
+
+ROUNDS = 2_000
+
+
+class Writer:
+    """Stands in for an asyncio.StreamWriter and its transport, counting what it is given."""
+
+    def __init__(self):
+        self.transport = self
+        self.bytes = 0
+
+    def writelines(self, chunks):
+        self.bytes += sum(map(len, chunks))
+
+    def get_write_buffer_size(self):
+        return 0
+
+    def set_write_buffer_limits(self, high=None, low=None):
+        pass
+
+
+def per_player_announce(room, player, message, exclude_player=False):
+    """Room.announce before broadcasts: one tell, and one encode, per occupant."""
+    for obj in room:
+        if exclude_player and obj is player:
+            continue
+        obj.tell(message)
+
+
+async def main():
+    listeners = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    with tempfile.TemporaryDirectory() as tmp:
+        world = World(path=str(Path(tmp) / "world.json"))
+        world.journal.enabled = False
+    room = world.contents["0"]
+    # as the server does, send everyone's output together
+    batch = OutputBatch()
+    for i in range(listeners):
+        player = Player(name=f"Player{i}", stdout=StreamWriterWrapper(Writer(), batch=batch))
+        world.add_player(player)
+    speaker = next(iter(room.players))
+    message = f'{speaker.name} says, "Hello, everyone in the room!"'
+
+    print(f"Room with {listeners} telnet listeners")
+    for label, announce in [("before", per_player_announce), ("after", type(room).announce)]:
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            announce(room, speaker, message)
+            # let the buffered output reach the transports
+            await asyncio.sleep(0)
+        seconds = time.perf_counter() - start
+        print(f"  {label:<7} {ROUNDS / seconds:10,.0f} announcements/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+"""Show the event loop keeps serving commands while a slow S3 save is written.
+
+CloudStorage is pointed at an in-memory stand-in for S3 whose requests take
+LATENCY seconds. A player walks between rooms while the world is saved, first
+by calling the blocking World.save() on the loop, then with request_save(),
+which awaits the storage executor. Last, an AI player's history is saved. The
+slowest command in each case shows how long the loop was held up.
+
+Usage: python benchmarks/bench_async_storage.py [latency]
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from botocore.exceptions import ClientError
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.moo.core.aiplayer import AIPlayer
+from src.moo.core.player import Player
+from src.moo.core.room import Room
+from src.moo.core.world import World
+from src.moo.storage import CloudStorage, ExecutorStorage
+
+LATENCY = float(sys.argv[1]) if len(sys.argv) > 1 else 0.5
+# how often the player sends a command
+INTERVAL = 0.01
+
+
+class FakeS3:
+    """Just enough of an S3 client for CloudStorage, with a delay on every request."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.objects = {}
+
+    def put_object(self, Bucket, Key, Body, **_kwargs):  # noqa: N803
+        time.sleep(self.latency)
+        self.objects[Bucket, Key] = Body
+
+    def get_object(self, Bucket, Key):  # noqa: N803
+        time.sleep(self.latency)
+        if (Bucket, Key) not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        body = self.objects[Bucket, Key]
+        return {"Body": mock.Mock(read=lambda: body)}
+
+    def list_objects_v2(self, Bucket, **_kwargs):  # noqa: N803
+        return {"Contents": [{"Key": key} for bucket, key in self.objects if bucket == Bucket]}
+
+
+async def walk(world, player, until):
+    """Walk back and forth between two rooms until the save is done, returning the slowest command."""
+    slowest = 0.0
+    direction = "north"
+    while not until.done():
+        start = time.perf_counter()
+        world.parse_command(player, f"go {direction}")
+        direction = "south" if direction == "north" else "north"
+        await asyncio.sleep(INTERVAL)
+        slowest = max(slowest, time.perf_counter() - start - INTERVAL)
+    return slowest
+
+
+async def blocking_save(world):
+    # give the walk a chance to start before the loop is blocked
+    await asyncio.sleep(INTERVAL)
+    world.save()
+
+
+async def main():
+    with tempfile.TemporaryDirectory() as tmp, mock.patch("boto3.client", return_value=FakeS3(LATENCY)):
+        world = World(path=str(Path(tmp) / "world.json"))
+        world.storage = CloudStorage(bucket_name="monkamoo")
+        world.journal.enabled = False
+        north = Room(name="North", exits={"south": "0"})
+        world.add(north)
+        world.contents["0"].exits["north"] = north.id
+        player = Player(name="walker")
+        world.add_player(player)
+        # out of the walker's way, so it isn't told about every move
+        attic = Room(name="Attic")
+        world.add(attic)
+        bot = AIPlayer(name="bot", location=attic)
+        bot.storage = ExecutorStorage(world.storage)
+        world.add_player(bot)
+        await bot.loading
+
+        print(f"S3 requests take {LATENCY * 1e3:.0f} ms")
+        saves = (
+            ("World.save()", lambda: blocking_save(world)),
+            ("request_save()", world.request_save),
+            ("save_history()", bot.save_history),
+        )
+        for name, save in saves:
+            world.mark_changed(north)
+            saving = asyncio.ensure_future(save())
+            slowest = await walk(world, player, saving)
+            await saving
+            print(f"  {name:15s} slowest command {slowest * 1e3:7.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+"""Measure how long a full world save stalls the event loop, blocking versus in the background.
+
+Usage: python benchmarks/bench_autosave.py [rooms]
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.moo.core.room import Room
+from src.moo.core.world import World
+
+ROOMS = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+
+async def worst_stall(save):
+    """Run save() alongside a 1ms ticker and return the longest gap between ticks."""
+    gaps = []
+    done = False
+
+    async def tick():
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    ticker = asyncio.create_task(tick())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await save()
+    elapsed = time.perf_counter() - start
+    done = True
+    await ticker
+    return elapsed, max(gaps)
+
+
+async def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        world = World(path=str(Path(tmp) / "world.json"))
+        for i in range(ROOMS):
+            world.add(Room(name=f"Room{i}", description="A room."))
+
+        async def blocking():
+            world.save(compact=True)
+
+        async def background():
+            # three overlapping requests coalesce into at most two saves
+            await asyncio.gather(*(world.request_save(compact=True) for _ in range(3)))
+
+        print(f"Full snapshot of a world with {ROOMS} rooms")
+        for label, save in (("blocking", blocking), ("background", background)):
+            elapsed, stall = await worst_stall(save)
+            print(f"  {label:10s} {elapsed * 1e3:8.1f} ms total  {stall * 1e3:8.1f} ms worst event-loop stall")
+        print(f"  {world.save_stats}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
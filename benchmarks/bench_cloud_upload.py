@@ -0,0 +1,100 @@
+"""Measure CloudStorage uploads against a local S3 stand-in: bytes sent and upload time, with and without gzip.
+
+The world is saved through World.save(), first in full, then again with nothing changed.
+The stand-in charges each request a round trip plus the time to send its body
+at BANDWIDTH bytes a second.
+
+Usage: python benchmarks/bench_cloud_upload.py [objects]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+from unittest import mock
+
+from botocore.exceptions import ClientError
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.moo.core.world import World
+from src.moo.storage import CloudStorage
+
+OBJECTS = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+ROUND_TRIP = 0.02
+BANDWIDTH = 10 * 2**20
+
+
+class LocalS3:
+    """An in-memory S3 bucket that keeps objects with their ContentEncoding."""
+
+    def __init__(self):
+        self.objects = {}
+        self.sent = 0
+
+    def put_object(self, Bucket, Key, Body, **kwargs):  # noqa: N803
+        time.sleep(ROUND_TRIP + len(Body) / BANDWIDTH)
+        self.sent += len(Body)
+        self.objects[Bucket, Key] = (Body, kwargs.get("ContentEncoding"))
+
+    def get_object(self, Bucket, Key):  # noqa: N803
+        if (Bucket, Key) not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        body, encoding = self.objects[Bucket, Key]
+        time.sleep(ROUND_TRIP + len(body) / BANDWIDTH)
+        response = {"Body": mock.Mock(read=lambda: body)}
+        if encoding:
+            response["ContentEncoding"] = encoding
+        return response
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    from bench_snapshot import synthetic_world
+
+    data = synthetic_world(OBJECTS)
+    history = [{"role": "user", "content": f"Message {i} in the conversation so far."} for i in range(1_000)]
+    s3 = LocalS3()
+    print(f"World of {OBJECTS} objects, {ROUND_TRIP * 1e3:.0f} ms round trips, {BANDWIDTH / 2**20:.0f} MiB/s")
+    os.environ.update(STORAGE_TYPE="local", WORLD_JOURNAL="false")
+    with tempfile.TemporaryDirectory() as tmp, mock.patch("boto3.client", return_value=s3):
+        path = Path(tmp) / "world.json"
+        path.write_text(json.dumps(data))
+        world = World(path=str(path))
+        world.load()
+        for compression in ("none", "gzip"):
+            storage = CloudStorage(bucket_name="monkamoo", compression=compression)
+            world.storage = storage
+            save_history = partial(storage.save_ai_history, "bot", history)
+            # the whole world to the new storage, then the world again with nothing changed
+            saves = (
+                ("world", partial(world.save, compact=True), world.save),
+                ("history", save_history, save_history),
+            )
+            for name, save, save_again in saves:
+                s3.sent = 0
+                _, upload = timed(save)
+                sent = s3.sent
+                _, unchanged = timed(save_again)
+                print(
+                    f"  {compression:5s} {name:8s} {sent / 2**10:9.0f} KiB sent in {upload:6.2f} s, "
+                    f"unchanged save {unchanged * 1e3:6.1f} ms ({s3.sent - sent} bytes sent)",
+                )
+        # objects uploaded before compression still load
+        legacy = CloudStorage(bucket_name="monkamoo", compression="none")
+        legacy.save_world(data)
+        loaded, load = timed(CloudStorage(bucket_name="monkamoo", compression="gzip").load_world)
+        assert loaded == data
+        print(f"  legacy uncompressed world loaded by gzip storage in {load:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Measure threads and memory held by idle shells.
+
+Compares shells that each create their own ThreadPoolExecutor (the previous
+behavior) with the shared executor only used for blocking stdin.
+
+A ThreadPoolExecutor only starts a thread on its first submit, and telnet
+shells read through async_readline without ever submitting, so idle telnet
+clients held no threads even with an executor each: for them only memory is
+reported. Threads are counted for shells reading a blocking stdin, here a
+pipe nothing is written to, where each per-shell executor starts a thread
+and the shared one stops at SHELL_INPUT_THREADS.
+
+Usage: python benchmarks/bench_idle_clients.py [clients] [stdin shells]
+"""
+
+import asyncio
+import io
+import os
+import sys
+import tempfile
+import threading
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.moo import shell
+from src.moo.core.world import World
+from src.moo.server import MonkaMOOServer
+
+CLIENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+STDIN_SHELLS = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+
+
+async def settle():
+    # let every shell start and block waiting for input
+    for _ in range(5):
+        await asyncio.sleep(0.05)
+
+
+async def measure_telnet(world, clients):
+    """Return the memory each idle telnet client holds, in bytes."""
+    server = MonkaMOOServer(world)
+    handlers = []
+
+    async def handle_client(reader, writer):
+        handlers.append(asyncio.current_task())
+        await server.handle_client(reader, writer)
+
+    listener = await asyncio.start_server(handle_client, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    connections = [await asyncio.open_connection("127.0.0.1", port) for _ in range(clients)]
+    await settle()
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # stop accepting, hang up every client and let each shell see its EOF and finish
+    listener.close()
+    for _, writer in connections:
+        writer.close()
+    await asyncio.gather(*(writer.wait_closed() for _, writer in connections))
+    await asyncio.gather(*handlers)
+    await listener.wait_closed()
+    return (end - start) / clients
+
+
+async def measure_stdin(world, shells):
+    """Return the threads started by shells waiting on a blocking stdin."""
+    threads = threading.active_count()
+    pipes = [os.pipe() for _ in range(shells)]
+    readers = [os.fdopen(read, "r") for read, _ in pipes]
+    loops = [
+        asyncio.ensure_future(shell.Shell(world, stdin=reader, stdout=io.StringIO()).cmdloop()) for reader in readers
+    ]
+    await settle()
+    started = threading.active_count() - threads
+    # end every stdin, so each shell reads its EOF and finishes
+    for _, write in pipes:
+        os.close(write)
+    await asyncio.gather(*loops)
+    for reader in readers:
+        reader.close()
+    return started
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        world = World(path=str(Path(tmp) / "world.json"))
+        world.journal.enabled = False
+    shared_init = shell.Shell.__init__
+    executors = []
+
+    def per_shell_init(self, *args, **kwargs):
+        shared_init(self, *args, **kwargs)
+        self.executor = ThreadPoolExecutor()
+        executors.append(self.executor)
+        self.get_executor = lambda: self.executor
+
+    print(f"{CLIENTS} idle telnet clients, {STDIN_SHELLS} shells waiting on a blocking stdin")
+    for label, init in [("per-shell executor", per_shell_init), ("shared executor", shared_init)]:
+        shell.Shell.__init__ = init
+        per_client = asyncio.run(measure_telnet(world, CLIENTS))
+        threads = asyncio.run(measure_stdin(world, STDIN_SHELLS))
+        print(f"  {label:<19} {per_client:10,.0f} bytes/telnet client {threads:5d} threads for stdin shells")
+        for executor in executors:
+            executor.shutdown()
+        executors.clear()
+        if shell.Shell.executor is not None:
+            shell.Shell.executor.shutdown()
+            shell.Shell.executor = None
+    shell.Shell.__init__ = shared_init
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Compare a full world snapshot with an incremental save of a few changes, by world size.
+
+Usage: python benchmarks/bench_incremental_save.py
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.moo.core.room import Room
+from src.moo.core.world import World
+
+SIZES = (1_000, 10_000, 100_000)
+CHANGES = 10
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'rooms':>8s} {'snapshot':>10s} {'incremental':>12s}  ({CHANGES} changed rooms)")
+    for size in SIZES:
+        with tempfile.TemporaryDirectory() as tmp:
+            world = World(path=str(Path(tmp) / "world.json"))
+            rooms = [Room(name=f"Room{i}", description="A room.") for i in range(size)]
+            for room in rooms:
+                world.add(room)
+            snapshot = timed(lambda world=world: world.save(compact=True))
+            for room in rooms[:CHANGES]:
+                room.description = "A changed room."
+            incremental = timed(world.save)
+        print(f"{size:8d} {snapshot * 1e3:8.1f}ms {incremental * 1e3:10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Measure writing and replaying a world journal of many entries.
+
+Usage: python benchmarks/bench_journal.py [entries]
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.moo.core.object import Object
+from src.moo.core.room import Room
+from src.moo.core.world import World
+
+ENTRIES = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+ROOMS = 1_000
+THINGS = 10_000
+
+
+async def write_journal(world, rooms, things):
+    """Journal ENTRIES moves of things between rooms, one entry per move."""
+    journal = world.journal
+    start = time.perf_counter()
+    for i in range(ENTRIES):
+        thing = things[i % THINGS]
+        thing.location = rooms[i % ROOMS]
+        journal.flush()
+    journal.sync_now()
+    return time.perf_counter() - start
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "world.json")
+        world = World(path=path)
+        rooms = [Room(name=f"Room{i}") for i in range(ROOMS)]
+        things = [Object(name=f"thing{i}") for i in range(THINGS)]
+        for obj in rooms + things:
+            world.add(obj)
+        world.save()
+
+        elapsed = asyncio.run(write_journal(world, rooms, things))
+        size = sum(path.stat().st_size for _, path in world.journal.segments())
+        print(f"{ENTRIES} journal entries, {size / 2**20:.0f} MiB")
+        print(f"  write     {elapsed:8.2f} s  {ENTRIES / elapsed:10.0f} entries/s")
+
+        start = time.perf_counter()
+        world.journal.changes()
+        elapsed = time.perf_counter() - start
+        print(f"  replay    {elapsed:8.2f} s  {ENTRIES / elapsed:10.0f} entries/s")
+
+        start = time.perf_counter()
+        World(path=path).load()
+        print(f"  load      {time.perf_counter() - start:8.2f} s  (snapshot, replay and rebuild)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Compare loading a whole world with paging its rooms in lazily: startup time, peak RSS and walking around.
+
+Each world is saved to SQLite storage, then loaded in a fresh process so its peak RSS is its own.
+
+Usage: python benchmarks/bench_lazy_world.py [objects ...]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_world_load import peak_rss
+
+from src.moo.core.world import World, WorldSnapshot
+from src.moo.storage import SQLiteStorage
+
+SIZES = [int(size) for size in sys.argv[1:] if size.isdigit()] or [10_000, 100_000, 1_000_000]
+STEPS = 1_000
+
+
+def child(path, lazy):
+    """Load the world, walk a player STEPS rooms north and print the timings and peak RSS."""
+    os.environ.update(STORAGE_TYPE="sqlite", WORLD_LAZY=lazy, WORLD_JOURNAL="false")
+    start = time.perf_counter()
+    world = World(path=path)
+    world.load()
+    startup = time.perf_counter() - start
+    player = world.find_player("walker")
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        world.parse_command(player, "go north")
+    walk = time.perf_counter() - start
+    print(json.dumps({"startup": startup, "walk": walk, "resident": len(world.contents), "peak_mib": peak_rss()}))
+
+
+def main():
+    from bench_snapshot import synthetic_world
+
+    print(f"{'objects':>9s} {'mode':>5s} {'startup':>9s} {f'{STEPS} moves':>11s} {'resident':>9s} {'peak RSS':>10s}")
+    for size in SIZES:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "world.json")
+            records = synthetic_world(size)["contents"]
+            start = next(iter(records))
+            player = str(uuid.uuid4())
+            records[player] = {"type": "Player", "id": player, "name": "walker", "description": None, "location": start}
+            SQLiteStorage(world_path=path).save_world(WorldSnapshot(1, records, [], True, 0))
+            del records
+            for lazy in ("false", "true"):
+                output = subprocess.run(
+                    [sys.executable, __file__, "--child", path, lazy],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                    cwd=tmp,
+                ).stdout
+                result = json.loads(output.splitlines()[-1])
+                print(
+                    f"{size:9d} {'lazy' if lazy == 'true' else 'full':>5s} {result['startup']:8.2f}s "
+                    f"{result['walk']:10.2f}s {result['resident']:9d} {result['peak_mib']:8.0f}MiB",
+                )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2], sys.argv[3])
+    else:
+        main()
@@ -0,0 +1,63 @@
+"""Benchmark World.find_player / find_room / find_thing against the linear scan.
+
+Usage: python benchmarks/bench_name_index.py
+"""
+
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.moo.core.object import Object
+from src.moo.core.player import Player
+from src.moo.core.room import Room
+from src.moo.core.world import World
+
+ROOMS = 10_000
+PLAYERS = 1_000
+LOOKUPS = 1_000
+
+
+def scan(objects, name):
+    """The lookup before the name index: a case-insensitive linear scan."""
+    for obj in objects:
+        if obj.name and obj.name.lower() == name.lower():
+            return obj
+    return None
+
+
+def build_world(path):
+    world = World(path=path)
+    world.journal.enabled = False
+    for i in range(ROOMS):
+        world.add(Room(name=f"Room{i}"))
+        world.add(Object(name=f"thing{i}"))
+    for i in range(PLAYERS):
+        world.add(Player(name=f"Player{i}"))
+    return world
+
+
+def report(label, seconds):
+    print(f"  {label:<8} {seconds / LOOKUPS * 1e6:10.2f} us/lookup")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        world = build_world(str(Path(tmp) / "world.json"))
+    print(f"World with {ROOMS} rooms, {ROOMS} things and {PLAYERS} players")
+    cases = [
+        ("find_player", "player999", lambda: list(world.players)),
+        ("find_room", "room9999", lambda: list(world.rooms)),
+        ("find_thing", "THING9999", lambda: list(world.things)),
+    ]
+    for method, name, objects in cases:
+        assert scan(objects(), name) is getattr(world, method)(name)
+        print(f"{method}({name!r})")
+        report("before", timeit.timeit(lambda objects=objects, name=name: scan(objects(), name), number=LOOKUPS))
+        report("after", timeit.timeit(lambda method=method, name=name: getattr(world, method)(name), number=LOOKUPS))
+
+
+if __name__ == "__main__":
+    main()
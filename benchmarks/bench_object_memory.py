@@ -0,0 +1,51 @@
+"""Report memory used per MOO object for a large number of leaf objects.
+
+Compares the current slotted Base against the previous dict-backed layout.
+
+Usage: python benchmarks/bench_object_memory.py [count]
+"""
+
+import sys
+import tracemalloc
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.moo.core.ball import Ball
+from src.moo.core.object import Object
+from src.moo.core.room import Room
+
+
+class LegacyBase:
+    """The object layout before __slots__: a __dict__ and an eager contents dict."""
+
+    def __init__(self, **kwargs):
+        self.id = str(uuid.uuid4())
+        self.world = None
+        self.name = None
+        self.description = None
+        self.location = None
+        self.contents = {}
+        self.__dict__.update(kwargs)
+
+
+def measure(cls, count):
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    objects = [cls(name=f"thing{i}", description="A thing.") for i in range(count)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # the list holding the objects isn't part of the per-object cost
+    return (end - start - sys.getsizeof(objects)) / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{count} objects")
+    for cls in [LegacyBase, Object, Ball, Room]:
+        print(f"  {cls.__name__:<10} {measure(cls, count):8.1f} bytes/object")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark line_parser.Parser over a recorded command corpus.
+
+Compares the previous word-at-a-time parser, the trie tokenizer without the
+parse cache, and the trie tokenizer with the LRU cache.
+
+Usage: python benchmarks/bench_parser.py [corpus]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.moo.line_parser import Command, Parser, Preposition
+
+ROUNDS = 400
+# the best of several runs, as the machine's noise only ever makes a run slower
+REPEATS = 5
+
+
+def legacy_parse(line):
+    """The parser before the preposition trie and parse cache."""
+    if not line:
+        return None
+    words = line.strip(" .").split(" ")
+    words = [w for w in words if w.lower() not in Parser.articles]
+    if not words:
+        return None
+    verb = words[0].lower()
+    if len(words) == 1:
+        return Command(line, verb)
+    i = 1
+    preposition = None
+    for w in words[1:]:
+        preposition = Preposition.keys.get(w.lower())
+        if preposition:
+            break
+        i += 1
+    if preposition:
+        return Command(line, verb, " ".join(words[1:i]) or None, preposition, " ".join(words[i + 1 :]) or None)
+    return Command(line, verb, " ".join(words[1:]))
+
+
+def main():
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).with_name("command_corpus.txt")
+    corpus = [line.strip() for line in path.read_text().splitlines() if line.strip()]
+    print(f"{len(corpus)} commands from {path.name}, best of {REPEATS} runs of {ROUNDS} rounds")
+    cached = Parser.skeleton
+    rates = {}
+    for label, parse, skeleton in [
+        ("legacy", legacy_parse, cached),
+        ("trie", Parser.parse, staticmethod(cached.__wrapped__)),
+        ("cached", Parser.parse, cached),
+    ]:
+        Parser.skeleton = skeleton
+        seconds = min(
+            timeit.repeat(lambda parse=parse: [parse(line) for line in corpus], number=ROUNDS, repeat=REPEATS),
+        )
+        rates[label] = ROUNDS * len(corpus) / seconds
+        print(f"  {label:<7} {rates[label]:12,.0f} lines/s")
+    Parser.skeleton = cached
+    print(f"  cache   {Parser.skeleton.cache_info()}")
+    if rates["trie"] < rates["legacy"]:
+        print(
+            f"  uncached, the trie parser runs at {rates['trie'] / rates['legacy']:.0%} of the legacy parser's speed: "
+            "it also matches multi-word prepositions and finds where indirect_args start",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Benchmark Command.resolve in a crowded room.
+
+Usage: python benchmarks/bench_resolve.py
+"""
+
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.moo.core.object import Object
+from src.moo.core.player import Player
+from src.moo.core.world import World
+from src.moo.line_parser import Parser
+
+OBJECTS = 5_000
+ROUNDS = 1_000
+
+
+def scan_resolve(player, name):
+    """Object resolution before the container name index."""
+    name = name.lower()
+    for obj in list(player.contents.values()) + list(player.location.contents.values()):
+        if obj.name.lower() == name:
+            return obj
+    return None
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        world = World(path=str(Path(tmp) / "world.json"))
+        world.journal.enabled = False
+    player = Player(name="Jim")
+    world.add_player(player)
+    for i in range(OBJECTS):
+        Object(name=f"Thing{i}").move(player.location)
+    command = Parser.parse(f"put thing{OBJECTS - 1} in thing{OBJECTS // 2}")
+
+    def before():
+        scan_resolve(player, command.direct_object_str)
+        scan_resolve(player, command.indirect_object_str)
+
+    def after():
+        command.resolve(world, player)
+
+    after()
+    assert command.direct_object is scan_resolve(player, command.direct_object_str)
+    print(f"Room with {OBJECTS} objects: {command.line!r}")
+    for label, function in [("before", before), ("after", after)]:
+        seconds = timeit.timeit(function, number=ROUNDS)
+        print(f"  {label:<7} {seconds / ROUNDS * 1e6:10.2f} us/resolve")
+
+
+if __name__ == "__main__":
+    main()
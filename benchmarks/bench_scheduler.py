@@ -0,0 +1,64 @@
+"""Measure command latency for ordinary players while one client floods commands.
+
+Usage: python benchmarks/bench_scheduler.py
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.moo.core.player import Player
+from src.moo.core.world import World
+
+PLAYERS = 20
+SECONDS = 2.0
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))] if values else 0.0
+
+
+async def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        world = World(path=str(Path(tmp) / "world.json"))
+        world.journal.enabled = False
+    flooder = Player(name="Flooder")
+    world.add_player(flooder)
+    players = [Player(name=f"Player{i}") for i in range(PLAYERS)]
+    for player in players:
+        world.add_player(player)
+    scheduler = world.scheduler
+    latencies = []
+
+    async def flood():
+        while True:
+            for _ in range(100):
+                scheduler.submit(flooder, "look")
+            await asyncio.sleep(0.001)
+
+    async def play(player):
+        while True:
+            start = time.perf_counter()
+            await scheduler.execute(player, lambda player=player: world.parse_command(player, "look"))
+            latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(0.05)
+
+    tasks = [asyncio.create_task(flood())] + [asyncio.create_task(play(player)) for player in players]
+    await asyncio.sleep(SECONDS)
+    for task in tasks:
+        task.cancel()
+
+    print(f"{PLAYERS} players running `look` every 50ms alongside a client flooding `look`")
+    print(f"  player commands   {len(latencies):8d}")
+    print(f"  latency p50       {percentile(latencies, 0.5) * 1e3:8.2f} ms")
+    print(f"  latency p99       {percentile(latencies, 0.99) * 1e3:8.2f} ms")
+    print(f"  scheduler         {scheduler.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+"""Compare world.json with the binary snapshot format: file size and startup time.
+
+Usage: python benchmarks/bench_snapshot.py [objects]
+"""
+
+import json
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.moo.core.world import World
+from src.moo.storage import LocalFileStorage, snapshot
+
+OBJECTS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+# one object in ten is a room, the rest are things spread between them
+ROOM_EVERY = 10
+
+
+def synthetic_world(count):
+    rooms = [str(uuid.uuid4()) for _ in range(count // ROOM_EVERY)]
+    contents = {}
+    for i, id in enumerate(rooms):
+        contents[id] = {
+            "type": "Room",
+            "id": id,
+            "name": f"Room {i}",
+            "description": "A featureless room.",
+            "location": None,
+            "exits": {"north": rooms[(i + 1) % len(rooms)], "south": rooms[i - 1]},
+        }
+    for i in range(count - len(rooms)):
+        id = str(uuid.uuid4())
+        contents[id] = {
+            "type": "Object",
+            "id": id,
+            "name": f"thing{i}",
+            "description": None,
+            "location": rooms[i % len(rooms)],
+        }
+    return {"contents": contents, "generation": 1}
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        world_path = Path(tmp) / "world.json"
+        data = synthetic_world(OBJECTS)
+        world_path.write_text(json.dumps(data, sort_keys=True, indent=2, separators=(",", ": ")))
+        snapshot.convert(world_path, world_path.with_suffix(".moo"))
+        del data
+
+        print(f"World of {OBJECTS} objects")
+        for world_format, path in (("json", world_path), ("binary", world_path.with_suffix(".moo"))):
+            storage = LocalFileStorage(world_path=str(world_path), bots_dir=tmp, world_format=world_format)
+            parse = timed(storage.load_world)
+            world = World(path=str(world_path))
+            world.storage = storage
+            startup = timed(world.load)
+            print(
+                f"  {world_format:7s} {path.stat().st_size / 2**20:8.1f} MiB  "
+                f"{parse:6.2f} s to parse  {startup:6.2f} s to load the world",
+            )
+            del world
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark web player output: a task and frame per line vs. per-tick coalescing.
+
+Each round, every player runs `look` (several lines) and hears a few lines of
+room chatter, then the event loop gets a chance to deliver everything.
+
+Usage: python benchmarks/bench_socket_output.py [players]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.moo.broker import Broker, ChannelOutput
+
+ROUNDS = 200
+LOOK = [
+    "*** Attic ***",
+    "You are in a dusty attic, filled with old books and instruments.",
+    "You can go North or down.",
+    "Charlotte is here.",
+    "There is rainbox and Book here.",
+]
+CHATTER = ['Charlotte says, "Hi!"', "Poe waves.", "Jim enters the room."]
+
+
+class LineOutput:
+    """SocketOutput before coalescing: a task and a publish for every line."""
+
+    def __init__(self, broker, channel):
+        self.broker = broker
+        self.channel = channel
+
+    def write(self, message):
+        asyncio.create_task(self.broker.publish(self.channel, message))
+
+    def flush(self):
+        pass
+
+
+async def run(output_class, players):
+    broker = Broker(maxsize=0)
+    frames = 0
+    tasks = 0
+    loop = asyncio.get_running_loop()
+
+    def task_factory(loop, coro, **kwargs):
+        nonlocal tasks
+        tasks += 1
+        return asyncio.Task(coro, loop=loop, **kwargs)
+
+    async def consume(channel):
+        nonlocal frames
+        async for _ in broker.subscribe(channel):
+            frames += 1
+
+    channels = [f"player{i}" for i in range(players)]
+    consumers = [asyncio.create_task(consume(channel)) for channel in channels]
+    outputs = [output_class(broker, channel) for channel in channels]
+    await asyncio.sleep(0)
+    loop.set_task_factory(task_factory)
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for output in outputs:
+            for line in LOOK + CHATTER:
+                output.write(line + "\n")
+                output.flush()
+        # let every queued publish and consumer run
+        for _ in range(3):
+            await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    loop.set_task_factory(None)
+    for consumer in consumers:
+        consumer.cancel()
+    return tasks / elapsed, frames / elapsed, frames
+
+
+def main():
+    players = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    print(f"{players} web players, {ROUNDS} rounds of {len(LOOK + CHATTER)} lines each")
+    for label, output_class in [("per line", LineOutput), ("per tick", ChannelOutput)]:
+        tasks, frames_rate, frames = asyncio.run(run(output_class, players))
+        print(f"  {label:<9} {tasks:10,.0f} tasks/s {frames_rate:10,.0f} frames/s ({frames:,} frames)")
+
+
+if __name__ == "__main__":
+    main()
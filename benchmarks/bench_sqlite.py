@@ -0,0 +1,72 @@
+"""Compare local JSON storage with SQLite storage: loading, saving and updating one object.
+
+Usage: python benchmarks/bench_sqlite.py [objects]
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.moo.core.world import World
+from src.moo.storage import LocalFileStorage, SQLiteStorage
+
+OBJECTS = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+UPDATES = 100
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    from bench_snapshot import synthetic_world
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "source.json"
+        source.write_text(json.dumps(synthetic_world(OBJECTS)))
+        storages = {
+            "json": lambda: LocalFileStorage(world_path=str(Path(tmp) / "world.json"), bots_dir=tmp),
+            "sqlite": lambda: SQLiteStorage(world_path=str(Path(tmp) / "world.json")),
+        }
+
+        print(f"World of {OBJECTS} objects")
+        for name, storage in storages.items():
+            world = World(path=str(source))
+            world.load()
+            world.storage = storage()
+            world.journal.enabled = False
+            save = timed(world.save)
+
+            things = [obj for obj in world.contents.values() if obj.location is not None]
+
+            def update(world=world, things=things):
+                for i in range(UPDATES):
+                    things[i].name = f"renamed{i}"
+                    world.save()
+
+            update_time = timed(update) / UPDATES
+            target = things[0].id
+            if isinstance(world.storage, SQLiteStorage):
+                read_one = timed(lambda storage=world.storage, target=target: storage.load_objects(ids=[target]))
+            else:
+                read_one = timed(lambda storage=world.storage, target=target: storage.load_world()["contents"][target])
+
+            loaded = World(path=str(source))
+            loaded.storage = world.storage
+            loaded.journal.enabled = False
+            load = timed(loaded.load)
+            assert loaded.contents[target].name == "renamed0"
+            print(
+                f"  {name:7s} save {save:6.2f} s  load {load:6.2f} s  "
+                f"update one object {update_time * 1e3:7.2f} ms  read one object {read_one * 1e3:8.2f} ms",
+            )
+
+
+if __name__ == "__main__":
+    main()
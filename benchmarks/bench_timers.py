@@ -0,0 +1,74 @@
+"""Compare the world's timing wheel with a task per timer for many pending timers.
+
+Usage: python benchmarks/bench_timers.py [timers]
+"""
+
+import asyncio
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.moo.timers import TimingWheel
+
+TIMERS = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+# timers are spread over this many seconds
+SPREAD = 2.0
+
+
+async def task_per_timer(count):
+    fired = 0
+
+    def fire():
+        nonlocal fired
+        fired += 1
+
+    async def perform_after(interval):
+        await asyncio.sleep(interval)
+        fire()
+
+    tasks = [asyncio.create_task(perform_after(SPREAD * i / count)) for i in range(count)]
+    # let every task start its sleep
+    await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    return fired
+
+
+async def timing_wheel(count):
+    fired = 0
+    wheel = TimingWheel()
+
+    def fire():
+        nonlocal fired
+        fired += 1
+
+    handles = [wheel.schedule(SPREAD * i / count, fire) for i in range(count)]
+    # cancel every tenth timer, which the task approach can't do at all
+    for handle in handles[::10]:
+        handle.cancel()
+    while len(wheel):
+        await asyncio.sleep(wheel.tick)
+    wheel.task.cancel()
+    return fired
+
+
+def measure(label, coroutine):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fired = asyncio.run(coroutine(TIMERS))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:16s} {elapsed:8.2f} s  {peak / 2**20:8.1f} MiB peak  {fired:8d} fired")
+
+
+def main():
+    print(f"{TIMERS} timers spread over {SPREAD:.0f}s")
+    measure("task per timer", task_per_timer)
+    measure("timing wheel", timing_wheel)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark World.parse_command throughput with and without the class verb tables.
+
+Usage: python benchmarks/bench_verb_dispatch.py
+"""
+
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.moo.core.base import Base
+from src.moo.core.object import Object
+from src.moo.core.player import Player
+from src.moo.core.world import World
+
+COMMANDS = [
+    "look",
+    "look at ball",
+    "take ball",
+    "drop ball",
+    "name ball as ball",
+    "describe ball as A red ball.",
+    "find jim",
+    "frobnicate ball",
+]
+ROUNDS = 2_000
+
+
+def probe_function(self, verb):
+    """The previous dispatch: two getattr probes per object."""
+    for key in [verb, "do_" + verb]:
+        method = getattr(self, key, None)
+        if method and callable(method):
+            return method
+    return None
+
+
+def run(world, player):
+    for line in COMMANDS:
+        world.parse_command(player, line)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        world = World(path=str(Path(tmp) / "world.json"))
+        world.journal.enabled = False
+    player = Player(name="Jim")
+    world.add_player(player)
+    Object(name="ball").move(player.location)
+
+    table_function = Base.get_function
+    results = {}
+    for label, function in [("probe", probe_function), ("table", table_function)]:
+        Base.get_function = function
+        seconds = timeit.timeit(lambda: run(world, player), number=ROUNDS)
+        results[label] = ROUNDS * len(COMMANDS) / seconds
+    Base.get_function = table_function
+
+    for label, rate in results.items():
+        print(f"  {label:<6} {rate:12,.0f} commands/s")
+    print(f"  speedup {results['table'] / results['probe']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Measure World.load time and peak RSS, streaming objects versus parsing the whole file first.
+
+Each load runs in a fresh process so its peak RSS is its own.
+
+Usage: python benchmarks/bench_world_load.py [objects ...]
+"""
+
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.moo.core.world import World
+from src.moo.storage import StorageInterface
+
+SIZES = [int(size) for size in sys.argv[1:] if size.isdigit()] or [10_000, 100_000, 1_000_000]
+
+
+def peak_rss():
+    """Return the peak RSS of this process in MiB.
+
+    ru_maxrss carries over the parent's peak across fork and exec, so VmHWM is used where there is one.
+    """
+    status = Path("/proc/self/status")
+    if status.exists():
+        for line in status.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def child(path, mode):
+    """Load the world at path and print the load time and peak RSS."""
+    world = World(path=path)
+    if mode == "whole":
+        # the non-streaming fallback: load_world() parses everything, then objects are created
+        world.storage.stream_world = lambda: StorageInterface.stream_world(world.storage)
+    start = time.perf_counter()
+    world.load()
+    elapsed = time.perf_counter() - start
+    print(json.dumps({"objects": len(world.contents), "seconds": elapsed, "peak_mib": peak_rss()}))
+
+
+def main():
+    from bench_snapshot import synthetic_world
+
+    print(f"{'objects':>9s} {'mode':>7s} {'load':>9s} {'peak RSS':>10s}")
+    for size in SIZES:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "world.json"
+            path.write_text(json.dumps(synthetic_world(size), sort_keys=True, indent=2, separators=(",", ": ")))
+            for mode in ("whole", "stream"):
+                output = subprocess.run(
+                    [sys.executable, __file__, "--child", str(path), mode],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                    cwd=tmp,
+                ).stdout
+                result = json.loads(output.splitlines()[-1])
+                print(f"{size:9d} {mode:>7s} {result['seconds']:8.2f}s {result['peak_mib']:8.0f}MiB")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2], sys.argv[3])
+    else:
+        main()
@@ -1,4 +1,6 @@
 import asyncio
+import logging
+import os
 from collections.abc import AsyncGenerator
 
 from .logging_config import get_logger
@@ -6,29 +8,166 @@ from .logging_config import get_logger
 # Get logger for this module
 logger = get_logger("monkamoo.broker")
 
+# What to do when a subscriber's queue is full
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+DISCONNECT = "disconnect"
+POLICIES = (DROP_OLDEST, DROP_NEWEST, DISCONNECT)
+
+# Queued after a disconnect to end the subscriber's generator
+CLOSED = object()
+
 
 class Broker:
-    def __init__(self) -> None:
+    """Fans messages out to per-channel subscribers through bounded queues.
+
+    A subscriber that falls behind by more than `maxsize` messages is handled by
+    the overflow `policy`: drop its oldest queued message, drop the new one, or
+    disconnect it. Defaults come from BROKER_QUEUE_SIZE (0 for unbounded) and
+    BROKER_OVERFLOW.
+    """
+
+    def __init__(self, maxsize: int | None = None, policy: str | None = None) -> None:
         self.channels = {}
+        self.maxsize = maxsize if maxsize is not None else int(os.getenv("BROKER_QUEUE_SIZE", "1000"))
+        self.policy = policy or os.getenv("BROKER_OVERFLOW", DROP_OLDEST).lower()
+        if self.policy not in POLICIES:
+            msg = f"Unknown broker overflow policy: {self.policy}"
+            raise ValueError(msg)
+        self.dropped = {}
+        self.disconnected = {}
+        # ChannelOutputs with buffered writes, and the scheduled flush of all of them
+        self.pending_outputs = []
+        self.flush_handle = None
 
     async def publish(self, channel: str, message: str) -> None:
-        connections = self.channels.setdefault(channel, set())
-        logger.debug(
-            "Publishing message to channel %s: %s",
-            channel,
-            message[:100] + "..." if len(message) > 100 else message,
-        )
-        for connection in connections:
-            await connection.put(message)
+        await self.publish_batch([channel], [message])
+
+    async def publish_many(self, channels: list[str], message: str) -> None:
+        """Publish one message to several channels in a single pass."""
+        await self.publish_batch(channels, [message])
+
+    async def publish_batch(self, channels: list[str], messages: list[str]) -> None:
+        """Publish several messages, in order, to each of several channels."""
+        if logger.isEnabledFor(logging.DEBUG):
+            preview = "\n".join(messages)
+            logger.debug(
+                "Publishing %d message(s) to channels %s: %s",
+                len(messages),
+                ", ".join(channels),
+                preview[:100] + "..." if len(preview) > 100 else preview,
+            )
+        for channel in channels:
+            connections = self.channels.get(channel)
+            if not connections:
+                continue
+            for connection in list(connections):
+                for message in messages:
+                    self.offer(channel, connection, message)
+
+    def offer(self, channel: str, connection: asyncio.Queue, message: str) -> None:
+        """Queue a message for one subscriber without waiting, applying the overflow policy."""
+        if not connection.full():
+            connection.put_nowait(message)
+            return
+        if self.policy == DROP_NEWEST:
+            self.dropped[channel] = self.dropped.get(channel, 0) + 1
+        elif self.policy == DROP_OLDEST:
+            connection.get_nowait()
+            connection.put_nowait(message)
+            self.dropped[channel] = self.dropped.get(channel, 0) + 1
+        else:
+            self.disconnect(channel, connection)
+
+    def disconnect(self, channel: str, connection: asyncio.Queue) -> None:
+        self.channels.get(channel, set()).discard(connection)
+        self.dropped[channel] = self.dropped.get(channel, 0) + connection.qsize()
+        self.disconnected[channel] = self.disconnected.get(channel, 0) + 1
+        while not connection.empty():
+            connection.get_nowait()
+        connection.put_nowait(CLOSED)
+        logger.warning("Disconnected slow subscriber from channel: %s", channel)
+
+    def stats(self, channel: str) -> dict:
+        """Return subscriber count, queue depth and drop counters for a channel."""
+        connections = self.channels.get(channel, set())
+        depths = [connection.qsize() for connection in connections]
+        return {
+            "subscribers": len(connections),
+            "depth": sum(depths),
+            "max_depth": max(depths, default=0),
+            "dropped": self.dropped.get(channel, 0),
+            "disconnected": self.disconnected.get(channel, 0),
+        }
 
     async def subscribe(self, channel: str) -> AsyncGenerator[str, None]:
         connections = self.channels.setdefault(channel, set())
-        connection = asyncio.Queue()
+        connection = asyncio.Queue(self.maxsize)
         connections.add(connection)
         logger.info("New subscription to channel: %s (total connections: %d)", channel, len(connections))
         try:
             while True:
-                yield await connection.get()
+                message = await connection.get()
+                if message is CLOSED:
+                    return
+                yield message
         finally:
-            connections.remove(connection)
+            connections.discard(connection)
             logger.info("Subscription ended for channel: %s (remaining connections: %d)", channel, len(connections))
+
+
+class ChannelOutput:
+    """A file-like output that publishes what is written to a broker channel.
+
+    Writes are buffered and every output of the broker with pending data is
+    flushed together once per event-loop tick, or `delay` seconds after the first write
+    (BROKER_FLUSH_DELAY), so a burst of lines reaches the subscriber as one
+    message, in order.
+    """
+
+    delay = float(os.getenv("BROKER_FLUSH_DELAY", "0"))
+
+    def __init__(self, broker: Broker, channel: str) -> None:
+        self.broker = broker
+        self.channel = channel
+        self.buffer = []
+
+    def write(self, message: str) -> None:
+        broker = self.broker
+        if not self.buffer:
+            broker.pending_outputs.append(self)
+        self.buffer.append(message)
+        if broker.flush_handle is None:
+            loop = asyncio.get_running_loop()
+            if ChannelOutput.delay > 0:
+                broker.flush_handle = loop.call_later(ChannelOutput.delay, ChannelOutput.flush_pending, broker)
+            else:
+                broker.flush_handle = loop.call_soon(ChannelOutput.flush_pending, broker)
+
+    def flush(self) -> None:
+        # buffered lines go out with the next flush_pending()
+        pass
+
+    @staticmethod
+    def write_many(outputs: list["ChannelOutput"], message: str) -> None:
+        for output in outputs:
+            output.write(message)
+
+    @staticmethod
+    def flush_pending(broker: Broker) -> None:
+        """Publish every buffered output of a broker, sending identical frames with one publish_many."""
+        outputs = broker.pending_outputs
+        broker.pending_outputs = []
+        broker.flush_handle = None
+        frames = {}
+        for output in outputs:
+            frame = "".join(output.buffer)
+            output.buffer = []
+            frames.setdefault(frame, []).append(output.channel)
+        if frames:
+            asyncio.get_running_loop().create_task(ChannelOutput.send(broker, frames))
+
+    @staticmethod
+    async def send(broker: Broker, frames: dict) -> None:
+        for frame, channels in frames.items():
+            await broker.publish_many(channels, frame)
@@ -0,0 +1,152 @@
+import itertools
+import math
+import time
+
+from .logging_config import get_logger
+
+# Get logger for this module
+logger = get_logger("monkamoo.connections")
+
+# Time constant, in seconds, of the decaying commands-per-second rate
+RATE_WINDOW = 10.0
+
+
+class Connection:
+    """A client connection and its traffic statistics."""
+
+    def __init__(self, registry, id, peer, writer):
+        self.registry = registry
+        self.id = id
+        self.peer = peer
+        self.writer = writer
+        self.output = None
+        self.player = None
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.commands = 0
+        self.rate = 0.0
+        self.connected_at = self.last_activity = time.monotonic()
+
+    def __repr__(self):
+        return f"<Connection {self.id} peer={self.peer} player={self.player and self.player.name}>"
+
+    def received(self, data):
+        now = time.monotonic()
+        self.rate = self.commands_per_second(now) + 1 / RATE_WINDOW
+        self.last_activity = now
+        self.bytes_in += len(data)
+        self.commands += 1
+        self.registry.received(self, len(data))
+
+    def sent(self, size):
+        self.bytes_out += size
+        self.registry.bytes_out += size
+
+    def bind(self, player):
+        self.registry.bind(self, player)
+
+    def commands_per_second(self, now=None):
+        elapsed = (now or time.monotonic()) - self.last_activity
+        return self.rate * math.exp(-elapsed / RATE_WINDOW)
+
+    def idle_time(self):
+        return time.monotonic() - self.last_activity
+
+    def stats(self):
+        return {
+            "id": self.id,
+            "peer": self.peer,
+            "player": self.player and self.player.name,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "commands": self.commands,
+            "commands_per_second": round(self.commands_per_second(), 3),
+            "idle": round(self.idle_time(), 3),
+            "connected": round(time.monotonic() - self.connected_at, 3),
+            "output": self.output.stats() if self.output else None,
+        }
+
+    def close(self):
+        self.writer.close()
+
+
+class ConnectionRegistry:
+    """Connections keyed by id, with O(1) add/remove and running totals.
+
+    Connections are also kept in order of last activity, so finding idle ones
+    only looks at the connections that have actually gone idle.
+    """
+
+    def __init__(self):
+        self.ids = itertools.count(1)
+        self.connections = {}
+        self.by_activity = {}
+        self.players = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.commands = 0
+
+    def __len__(self):
+        return len(self.connections)
+
+    def __iter__(self):
+        return iter(self.connections.values())
+
+    def add(self, peer, writer):
+        connection = Connection(self, next(self.ids), peer, writer)
+        self.connections[connection.id] = connection
+        self.by_activity[connection.id] = connection
+        logger.debug("Registered connection %d from %s (%d open)", connection.id, peer, len(self.connections))
+        return connection
+
+    def remove(self, connection):
+        self.connections.pop(connection.id, None)
+        self.by_activity.pop(connection.id, None)
+        self.bind(connection, None)
+        logger.debug("Unregistered connection %d (%d open)", connection.id, len(self.connections))
+
+    def get(self, id):
+        return self.connections.get(id)
+
+    def bind(self, connection, player):
+        if connection.player is not None and self.players.get(connection.player.id) is connection:
+            del self.players[connection.player.id]
+        connection.player = player
+        if player is not None:
+            self.players[player.id] = connection
+
+    def for_player(self, player):
+        return self.players.get(player.id)
+
+    def received(self, connection, size):
+        self.bytes_in += size
+        self.commands += 1
+        # move to the most recently active end
+        if self.by_activity.pop(connection.id, None):
+            self.by_activity[connection.id] = connection
+
+    def idle(self, timeout):
+        """Return connections with no input for at least timeout seconds, longest idle first."""
+        cutoff = time.monotonic() - timeout
+        idle = []
+        for connection in self.by_activity.values():
+            if connection.last_activity > cutoff:
+                break
+            idle.append(connection)
+        return idle
+
+    def reap(self, timeout):
+        idle = self.idle(timeout)
+        for connection in idle:
+            logger.info("Closing idle connection %d from %s", connection.id, connection.peer)
+            connection.close()
+        return len(idle)
+
+    def stats(self):
+        return {
+            "connections": len(self.connections),
+            "players": len(self.players),
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "commands": self.commands,
+        }
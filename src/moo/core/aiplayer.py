@@ -5,7 +5,7 @@ import os
 import openai
 
 from src.moo.logging_config import get_logger
-from src.moo.storage import get_storage_with_fallback
+from src.moo.storage import ExecutorStorage, get_storage_with_fallback
 
 from .player import Player
 
@@ -16,6 +16,8 @@ logger = get_logger("monkamoo.aiplayer")
 class AIPlayer(Player):
     """Represents an AI player in the MOO."""
 
+    not_verbs = Player.not_verbs | {"initial_history"}
+
     def __init__(self, api_key=None, **kwargs):
         super().__init__(**kwargs)
 
@@ -35,8 +37,16 @@ class AIPlayer(Player):
             self.client = None
             logger.warning("aiplayer=%s: No API key configured, AI functionality disabled", self.name)
 
-        self.storage = get_storage_with_fallback()
-        self.load_history()
+        self.storage = ExecutorStorage(get_storage_with_fallback())
+        self.history = self.initial_history()
+        self.loading = None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # no event loop to hold up, as when the world is loaded at startup
+            self.history = self.storage.sync.load_ai_history(self.name) or self.history
+        else:
+            self.loading = loop.create_task(self.load_history())
         self.captured_messages = None
         self.sleeping = False
         self.debugging = False
@@ -59,19 +69,20 @@ class AIPlayer(Player):
         self.sleeping = False
         self.room.announce(self, f"{self.name} wakes up.", exclude_player=True)
 
-    def load_history(self):
-        history = self.storage.load_ai_history(self.name)
-        if not history:
-            self.history = [
-                {
-                    "role": "system",
-                    "content": f'Responses should be in the third person, like in a story, e.g. "{self.name} says..." or "{self.name} looks around the room...".',
-                },
-            ]
-            return
-        self.history = history
+    def initial_history(self):
+        return [
+            {
+                "role": "system",
+                "content": f'Responses should be in the third person, like in a story, e.g. "{self.name} says..." or "{self.name} looks around the room...".',
+            },
+        ]
+
+    async def load_history(self):
+        history = await self.storage.load_ai_history(self.name)
+        if history:
+            self.history = history
 
-    def save_history(self):
+    async def save_history(self):
         if self.debugging:
             return
 
@@ -90,7 +101,7 @@ class AIPlayer(Player):
             return entry
 
         serializable_history = [make_serializable(msg) for msg in self.history]
-        success = self.storage.save_ai_history(self.name, serializable_history)
+        success = await self.storage.save_ai_history(self.name, serializable_history)
         if not success:
             logger.error("Failed to save AI history for %s", self.name)
 
@@ -118,6 +129,9 @@ class AIPlayer(Player):
         if not self.client:
             logger.warning("aiplayer=%s handle_message: message ignored: OpenAI api_key is not configured", self.name)
             return
+        if self.loading is not None:
+            # the saved history has to be in place before anything is added to it
+            await self.loading
         self.history.append(message)
         try:
             response = await self.generate()
@@ -139,7 +153,7 @@ class AIPlayer(Player):
             return None
         self.history.append({"role": "assistant", "content": content})
         self.location.announce(self, content, exclude_player=True)
-        self.save_history()
+        await self.save_history()
         return None
 
     async def generate(self):
@@ -394,31 +408,44 @@ class AIPlayer(Player):
                 },
             )
 
-            self.captured_messages = []
+            line = None
             if name == "go":
-                self.world.parse_command(self, "go {direction}".format(**arguments))
+                line = "go {direction}".format(**arguments)
             elif name == "look":
-                self.world.parse_command(self, "look {object}".format(**arguments))
+                line = "look {object}".format(**arguments)
             elif name == "name":
-                self.world.parse_command(self, "name {object} as {name}".format(**arguments))
+                line = "name {object} as {name}".format(**arguments)
             elif name == "describe":
-                self.world.parse_command(self, "describe {object} as {description}".format(**arguments))
+                line = "describe {object} as {description}".format(**arguments)
             elif name == "dig":
-                self.world.parse_command(self, "dig {direction} as {back}".format(**arguments))
+                line = "dig {direction} as {back}".format(**arguments)
             elif name == "whisper":
-                self.world.parse_command(self, "whisper {player} {message}".format(**arguments))
+                line = "whisper {player} {message}".format(**arguments)
             elif name == "take":
-                self.world.parse_command(self, "take {object}".format(**arguments))
+                line = "take {object}".format(**arguments)
             elif name == "drop":
-                self.world.parse_command(self, "drop {object}".format(**arguments))
+                line = "drop {object}".format(**arguments)
             elif name == "give":
-                self.world.parse_command(self, "give {object} to {player}".format(**arguments))
+                line = "give {object} to {player}".format(**arguments)
             elif name == "create":
-                self.world.parse_command(self, "create {name}".format(**arguments))
-            else:
-                self.captured_messages.append("Function not found.")
-            result = self.captured_messages
-            self.captured_messages = None
+                line = "create {name}".format(**arguments)
+
+            def run_tool(line=line):
+                # capture what the command tells us while it runs
+                self.captured_messages = []
+                try:
+                    if line:
+                        self.world.parse_command(self, line)
+                    else:
+                        self.captured_messages.append("Function not found.")
+                    return self.captured_messages
+                finally:
+                    self.captured_messages = None
+
+            # tool calls go through the scheduler like any other player's commands
+            result = await self.world.scheduler.execute(self, run_tool)
+            if result is None:
+                result = ["You are sending commands too fast. Slow down!"]
             logger.debug("aiplayer=%s handle_tool_call: result=%s", self.name, result)
 
             if not result:
@@ -4,6 +4,8 @@ from .object import Object
 class Ball(Object):
     """A simple ball."""
 
+    __slots__ = ()
+
     def bounce(self, command):
         self.room.announce(command.player, "The ball bounces up and down.")
 
@@ -1,22 +1,94 @@
 import asyncio
 import uuid
+from types import MappingProxyType
+
+# shared read-only stand-in for containers that hold nothing
+EMPTY = MappingProxyType({})
 
 
 class Base:
-    """The base class of all MOO objects."""
+    """The base class of all MOO objects.
+
+    Instances use __slots__ and only allocate their contents when something is
+    first added to them, since most objects in a world never contain anything.
+    Containers index their contents by type and by case-folded name. Changes to
+    the saved attributes mark the object as changed in its world (see touch()).
+    """
+
+    __slots__ = ("id", "world", "_name", "_description", "_location", "_contents", "_by_category", "_names")
+
+    # typed views of a container this class is listed under (see rooms, players, things)
+    categories = ("things",)
+
+    # every MOO class by name, for creating saved objects (see World.load)
+    classes = {}
+
+    # public methods that players can't call as verbs (see verbs())
+    not_verbs = frozenset(
+        ("attach", "category", "detach", "index", "lookup", "rename", "reset_verbs", "touch", "unindex", "verbs"),
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Base.classes[cls.__name__] = cls
 
     def __init__(self, **kwargs):
-        self.id = str(uuid.uuid4())
+        self.id = kwargs.pop("id") if "id" in kwargs else str(uuid.uuid4())
         self.world = None
+        self._location = None
         self.name = None
-        self.description = None
-        self.location = None
-        self.contents = {}
-        self.__dict__.update(kwargs)
+        self._description = None
+        self._contents = None
+        self._by_category = None
+        self._names = None
+        for key, value in kwargs.items():
+            setattr(self, key, value)
 
     def __repr__(self):
         return f'<{self.__class__.__name__} 0x{id(self):x} name="{self.name}">'
 
+    @property
+    def name(self):
+        return getattr(self, "_name", None)
+
+    @name.setter
+    def name(self, value):
+        old_name = getattr(self, "_name", None)
+        self._name = value
+        if old_name == value:
+            return
+        self.touch()
+        # keep the name indexes of the world and our location current
+        for container in (self.world, self.location):
+            if isinstance(container, Base):
+                container.rename(self, old_name)
+
+    @property
+    def description(self):
+        return self._description
+
+    @description.setter
+    def description(self, value):
+        self._description = value
+        self.touch()
+
+    @property
+    def location(self):
+        return self._location
+
+    @location.setter
+    def location(self, value):
+        self._location = value
+        self.touch()
+
+    def touch(self):
+        """Mark the object as changed since its world was last saved.
+
+        Contents aren't saved, they are rebuilt from each object's location.
+        """
+        if self.world is not None:
+            self.world.mark_changed(self)
+
     def json_dictionary(self):
         return {
             "type": self.__class__.__name__,
@@ -26,6 +98,15 @@ class Base:
             "location": self.location and self.location.id or None,
         }
 
+    @property
+    def contents(self):
+        return self._contents if self._contents is not None else EMPTY
+
+    def category(self, category):
+        if self._by_category is None:
+            return EMPTY
+        return self._by_category.get(category, EMPTY)
+
     def __contains__(self, obj):
         return hasattr(obj, "id") and obj.id in self.contents
 
@@ -44,12 +125,67 @@ class Base:
         if not hasattr(obj, "id"):
             raise ValueError
         self.world.add(obj)
-        self.contents[obj.id] = obj
+        self.attach(obj)
 
     def remove(self, obj):
         if not hasattr(obj, "id"):
             raise ValueError
-        del self.contents[obj.id]
+        self.detach(obj)
+
+    def attach(self, obj):
+        if self._contents is None:
+            self._contents = {}
+            self._by_category = {}
+            self._names = {}
+        self._contents[obj.id] = obj
+        for category in obj.categories:
+            self._by_category.setdefault(category, {})[obj.id] = obj
+        self.index(obj, obj.name)
+
+    def detach(self, obj):
+        if self._contents is None:
+            raise KeyError(obj.id)
+        del self._contents[obj.id]
+        for category in obj.categories:
+            self._by_category[category].pop(obj.id, None)
+        self.unindex(obj, obj.name)
+        if not self._contents:
+            self._contents = None
+            self._by_category = None
+            self._names = None
+
+    def index(self, obj, name):
+        if not name:
+            return
+        name = name.casefold()
+        # None indexes every object regardless of type
+        for category in (None, *obj.categories):
+            self._names.setdefault(category, {}).setdefault(name, {})[obj.id] = obj
+
+    def unindex(self, obj, name):
+        if not name:
+            return
+        name = name.casefold()
+        for category in (None, *obj.categories):
+            names = self._names.get(category, EMPTY)
+            matches = names.get(name)
+            if matches and matches.get(obj.id) is obj:
+                del matches[obj.id]
+                if not matches:
+                    del names[name]
+
+    def rename(self, obj, old_name):
+        if self.contents.get(obj.id) is not obj:
+            return
+        self.unindex(obj, old_name)
+        self.index(obj, obj.name)
+
+    def lookup(self, name, category=None):
+        """Return the first object in contents with the name, ignoring case."""
+        if not name or self._names is None:
+            return None
+        matches = self._names.get(category, EMPTY).get(name.casefold())
+        return next(iter(matches.values())) if matches else None
 
     def move(self, location, direction=None):
         if not location.accept(self):
@@ -96,24 +232,15 @@ class Base:
 
     @property
     def rooms(self):
-        # isort: skip
-        from .room import Room
-
-        return [obj for obj in self if isinstance(obj, Room)]
+        return self.category("rooms").values()
 
     @property
     def players(self):
-        # isort: skip
-        from .player import Player
-
-        return [obj for obj in self if isinstance(obj, Player)]
+        return self.category("players").values()
 
     @property
     def things(self):
-        # isort: skip
-        from .player import Player
-
-        return [obj for obj in self if not isinstance(obj, Player)]
+        return self.category("things").values()
 
     def find_room(self, name):
         # Allow using `@Player` to find the room the player is in
@@ -121,41 +248,60 @@ class Base:
             player = self.find_player(name.strip("@"))
             if player:
                 return player.location
-        for room in self.rooms:
-            if room.name and room.name.lower() == name.lower():
-                return room
-        return None
+        return self.lookup(name, "rooms")
 
     def find_player(self, name):
-        for player in self.players:
-            if player.name.lower() == name.lower():
-                return player
-        return None
+        return self.lookup(name, "players")
 
     def find_thing(self, name):
-        for obj in self.things:
-            if obj.name.lower() == name.lower():
-                return obj
-        return None
+        return self.lookup(name, "things")
+
+    @classmethod
+    def verbs(cls):
+        """Return the class verb table, mapping each verb to the method implementing it.
+
+        A verb is implemented by a public method named after it, or failing that by
+        a ``do_`` prefixed method; methods listed in not_verbs are never verbs. The
+        table is built on first use and cached on the class; call reset_verbs()
+        after replacing methods on a live class.
+        """
+        table = cls.__dict__.get("verb_table")
+        if table is None:
+            names = [
+                name
+                for name in dir(cls)
+                if not name.startswith("_") and name not in cls.not_verbs and callable(getattr(cls, name, None))
+            ]
+            table = {name: name for name in names}
+            for name in names:
+                if name.startswith("do_"):
+                    table.setdefault(name[3:], name)
+            cls.verb_table = table
+        return table
+
+    @classmethod
+    def reset_verbs(cls):
+        if "verb_table" in cls.__dict__:
+            del cls.verb_table
+        for subclass in cls.__subclasses__():
+            subclass.reset_verbs()
 
     def get_function(self, verb):
-        for key in [verb, "do_" + verb]:
-            method = getattr(self, key, None)
-            if method and callable(method):
-                return method
-        return None
+        key = self.verbs().get(verb)
+        return getattr(self, key) if key else None
 
     def tell(self, message=None):
         pass
 
     def timer(self, interval, function, args=None, kwargs=None):
+        """Call function after interval seconds; returns a handle with cancel()."""
         if kwargs is None:
             kwargs = {}
         if args is None:
             args = []
+        if self.world is not None:
+            return self.world.timers.schedule(interval, function, *args, **kwargs)
+        return asyncio.get_running_loop().call_later(interval, lambda: function(*args, **kwargs))
 
-        async def perform_after():
-            await asyncio.sleep(interval)
-            function(*args, **kwargs)
 
-        asyncio.create_task(perform_after())
+Base.classes["Base"] = Base
@@ -5,6 +5,8 @@ from .base import Base
 class Object(Base):
     """Represents a thing that can be picked up and put down."""
 
+    __slots__ = ()
+
     def take(self, command):
         player = command.player
         self.move(player)
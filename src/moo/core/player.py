@@ -7,9 +7,18 @@ from .base import Base
 logger = get_logger("monkamoo.player")
 
 
+def log_save_failure(task):
+    """Log the error of a background save that nothing awaits."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("World save failed", exc_info=task.exception())
+
+
 class Player(Base):
     """Represents a participant in the MOO."""
 
+    __slots__ = ("stdout",)
+    categories = ("players",)
+
     def __init__(self, **kwargs):
         self.stdout = None
         super().__init__(**kwargs)
@@ -18,7 +27,7 @@ class Player(Base):
         self.world.load()
 
     def do_save(self, _command):
-        self.world.save()
+        self.world.request_save().add_done_callback(log_save_failure)
 
     def tell(self, message):
         if self.stdout:
@@ -1,17 +1,24 @@
+from ..logging_config import get_logger
 from ..utils import join_strings
 from .base import Base
 from .player import Player
 
+# Get logger for this module
+logger = get_logger("monkamoo.room")
+
 
 class Room(Base):
     """Represents a room containing players and objects, with exits to other rooms."""
 
+    __slots__ = ("exits",)
+    categories = ("rooms", "things")
+
     def __init__(self, **kwargs):
         self.exits = {}
         super().__init__(**kwargs)
 
     def json_dictionary(self):
-        return dict(super().json_dictionary(), exits=self.exits)
+        return dict(super().json_dictionary(), exits=dict(self.exits))
 
     def find_exit(self, direction):
         for exit in self.exits:
@@ -20,10 +27,20 @@ class Room(Base):
         return None
 
     def announce(self, player, message, exclude_player=False):
+        # players whose output can take a broadcast are grouped by output type so
+        # the message is formatted and encoded once per type, not once per player
+        outputs = {}
         for obj in self:
             if exclude_player and obj is player:
                 continue
-            obj.tell(message)
+            stdout = getattr(obj, "stdout", None)
+            if type(obj).tell is Player.tell and hasattr(stdout, "write_many"):
+                outputs.setdefault(type(stdout), []).append(stdout)
+            else:
+                obj.tell(message)
+        for output_type, group in outputs.items():
+            output_type.write_many(group, message + "\n")
+        logger.debug("Room %s announced: %s", self.id, message)
 
     def on_enter(self, player, _direction=None):
         if not isinstance(player, Player):
@@ -78,10 +95,10 @@ class Room(Base):
         player = command.player
         direction = command.direct_object_str
         room_id = self.find_exit(direction)
-        if room_id is None:
+        room = self.world.fetch(room_id) if room_id is not None else None
+        if room is None:
             player.tell("You can't go that way.")
             return
-        room = self.world.contents[room_id]
         player.move(room, direction)
 
     def dig(self, command):
@@ -97,6 +114,7 @@ class Room(Base):
         room = Room(exits={back: self.id})
         self.world.add(room)
         self.exits[direction] = room.id
+        self.touch()
         self.announce(
             player,
             f"{player.name} created a room to the {direction}.",
@@ -1,6 +1,16 @@
+import asyncio
+import gc
+import os
+import time
+
 from .. import line_parser
+from ..journal import Journal
 from ..logging_config import get_logger
-from ..storage import get_storage_with_fallback
+from ..pager import Pager
+from ..scheduler import CommandScheduler
+from ..storage import ExecutorStorage, get_storage_with_fallback
+from ..storage.stream import overlay
+from ..timers import TimingWheel
 from .aiplayer import AIPlayer
 from .ball import Ball
 from .base import Base
@@ -8,13 +18,32 @@ from .object import Object
 from .player import Player
 from .room import Room
 
-# These imports are used dynamically via globals() lookup in the load() method
+# Importing these registers them in Base.classes, which load() creates objects from
 __all__ = ["AIPlayer", "Ball", "Base", "Object", "Player", "Room", "World"]
 
 # Get logger for this module
 logger = get_logger("monkamoo.world")
 
 
+class WorldSnapshot:
+    """The saved state of a world's objects at one moment.
+
+    Holds plain records rather than the objects themselves, so it can be
+    serialized and written off the event loop while the world keeps changing.
+    """
+
+    def __init__(self, generation, records, deleted, full, journal_segment):
+        self.generation = generation
+        self.records = records
+        self.deleted = deleted
+        self.full = full
+        # the first journal segment with changes this snapshot doesn't hold
+        self.journal_segment = journal_segment
+
+    def json_dictionary(self):
+        return {"contents": self.records, "generation": self.generation}
+
+
 class World(Base):
     """The root container of all MOO objects."""
 
@@ -24,67 +53,319 @@ class World(Base):
         super().__init__(**kwargs)
         self.path = path
         self.storage = get_storage_with_fallback(world_path=path or "world.json")
+        self.journal = Journal(path or "world.json")
+        self.scheduler = CommandScheduler(self)
+        self.timers = TimingWheel()
+        # objects changed or removed since the last save, written by the next one
+        self.changed = {}
+        self.deleted = set()
+        # incremental saves since the last full snapshot, None until one is written
+        self.incremental_saves = None
+        self.compact_every = int(os.getenv("WORLD_COMPACT_EVERY", "100"))
+        # snapshot number, so changes saved against an older snapshot are ignored
+        self.generation = 0
+        # seconds between background saves, 0 to only save on request
+        self.autosave_interval = float(os.getenv("WORLD_AUTOSAVE_INTERVAL", "300"))
+        self.autosaver = None
+        self.saver = None
+        # whether a snapshot is being written in the background
+        self.writing = False
+        # set when a load fails part way, so saves are refused until one succeeds (see load())
+        self.load_failed = False
+        self.save_requested = False
+        self.compact_requested = False
+        self.save_stats = {"saves": 0, "failed": 0, "coalesced": 0, "duration": 0.0, "pause": 0.0, "objects": 0}
+        # in lazy mode rooms are paged in from storage when needed, rather than all loaded at startup
+        self.pager = None
+        if os.getenv("WORLD_LAZY", "false").lower() == "true":
+            if self.storage.indexed and self.storage.incremental:
+                self.pager = Pager(self)
+            else:
+                logger.warning("WORLD_LAZY needs storage that can load part of the world, loading all of it")
         if not self.contents:
-            self.contents = {"0": Room(id="0", description="This is the beginning of the world.")}
+            self.add(Room(id="0", description="This is the beginning of the world."))
 
     def json_dictionary(self):
-        return {"contents": self.contents}
+        return {"contents": self.contents, "generation": self.generation}
 
     def load(self, _path=None):
+        """Load the world, creating each object as it is read from storage.
+
+        Objects are attached to their location as soon as both are loaded; an
+        object read before its location waits for it in `waiting`. The objects
+        only replace those in the world once all of them have been read, so a
+        load that fails part way leaves the world as it was, and refuses to
+        save it until a load succeeds.
+        """
         logger.info("Loading world using storage abstraction")
-        world_data = self.storage.load_world()
-        if not world_data:
+        if self.pager is not None:
+            if self.pager.load():
+                self.changed = {}
+                self.deleted = set()
+                self.journal.clear()
+            return
+        stream = self.storage.stream_world()
+        changes = self.journal.changes()
+        if stream is None and not changes:
             logger.warning("No world data found in storage")
             return
+        generation, records = stream or (0, iter(()))
+        objects = {}
+        waiting = {}
+        # nothing created while loading is garbage, so don't keep scanning the growing heap for cycles
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            for record in overlay(records, changes):
+                cls = Base.classes.get(record["type"])
+                if not cls:
+                    logger.error("Class not found: %s", record["type"])
+                    continue
+                location = record.get("location")
+                container = objects.get(location) if location else None
+                fields = {key: value for key, value in record.items() if key != "type"}
+                if container is not None:
+                    fields["location"] = container
+                obj = cls(**fields)
+                objects[obj.id] = obj
+                if container is not None:
+                    container.attach(obj)
+                elif location:
+                    waiting.setdefault(location, []).append(obj)
+                for child in waiting.pop(obj.id, ()):
+                    child.location = obj
+                    obj.attach(child)
+        except Exception:
+            logger.exception("Failed to load world after %d objects, keeping the world as it was", len(objects))
+            # what the world holds isn't what storage holds, so saving it would overwrite the saved world
+            self.load_failed = True
+            self.changed = {}
+            self.deleted = set()
+            return
+        finally:
+            if collecting:
+                gc.enable()
+        for obj in objects.values():
+            existing = self.contents.get(obj.id)
+            if existing is not None:
+                self.detach(existing)
+            self.attach(obj)
+        # locations that weren't loaded, but may already be in the world
+        for location, children in waiting.items():
+            container = self.contents.get(location)
+            for obj in children if container is not None else ():
+                obj.location = container
+                container.attach(obj)
+        # joining the world last, so building the objects isn't recorded as changing them
+        for obj in objects.values():
+            obj.world = self
+        self.load_failed = False
+        self.generation = generation or 0
+        self.changed = {}
+        self.deleted = set()
+        self.journal.clear()
+        if changes:
+            # the replayed changes are only in the journal until the next snapshot
+            self.incremental_saves = None
+        elif self.storage.in_place and len(self.contents) == len(objects):
+            # storage holds the world just as it was loaded, so the next save only has to write changes
+            self.incremental_saves = 0
+        logger.info("World loaded successfully: %d objects", len(objects))
 
-        world = world_data
-        all_contents = {}
-        loaded_objects = 0
-        for object_dict in world.get("contents", {}).values():
-            # get object class
-            class_name = object_dict.get("type")
-            cls = globals().get(class_name)
-            if not cls:
-                logger.error("Class not found: %s", class_name)
-                continue
-            del object_dict["type"]
-            # create object, building contents map
-            obj = cls(**object_dict)
-            if obj.location:
-                contents = all_contents.setdefault(obj.location, {})
-                contents[obj.id] = obj
-            self.add(obj)
-            loaded_objects += 1
-        # update objects with their contents
-        for id, contents in iter(all_contents.items()):
-            if id in self.contents:
-                self.contents[id].contents = contents
-        # replace location id with object
-        for obj in self.contents.values():
-            if obj.location and obj.location in self.contents:
-                obj.location = self.contents[obj.location]
-        logger.info("World loaded successfully: %d objects", loaded_objects)
-
-    def save(self, _path=None):
-        logger.info("Saving world using storage abstraction")
-        success = self.storage.save_world(self)
+    def snapshot(self, compact=False):
+        """Copy what the next save has to write and start tracking changes afresh.
+
+        Returns None if nothing has changed since a save that succeeded, or if
+        the world failed to load.
+        Every `compact_every` saves (WORLD_COMPACT_EVERY), on the first save
+        after startup, and for storage that can't save changes alone, the
+        snapshot holds the whole world. Storage that updates objects in place
+        needs no compacting, nor a whole world after loading from it.
+        In lazy mode only changes are ever saved, since the world isn't all in memory.
+        """
+        if self.load_failed:
+            logger.error("Not saving world, since it failed to load")
+            return None
+        if not (compact or self.changed or self.deleted) and self.incremental_saves is not None:
+            # storage already holds everything, even storage that only ever saves the whole world
+            return None
+        full = self.pager is None and (
+            not self.storage.incremental
+            or self.incremental_saves is None
+            or (not self.storage.in_place and (compact or self.incremental_saves >= self.compact_every))
+        )
+        if full:
+            objects = self.contents
+        elif self.changed or self.deleted:
+            objects = self.changed
+        else:
+            return None
+        records = {id: obj.json_dictionary() for id, obj in objects.items()}
+        # only once the records are copied, so a snapshot that fails leaves the next one to try again
+        if full:
+            self.generation += 1
+            self.incremental_saves = 0
+        else:
+            self.incremental_saves = (self.incremental_saves or 0) + 1
+        snapshot = WorldSnapshot(self.generation, records, sorted(self.deleted), full, self.journal.rotate())
+        self.changed = {}
+        self.deleted = set()
+        return snapshot
+
+    def write(self, snapshot):
+        """Write a snapshot to storage; safe to call from a worker thread."""
+        if snapshot.full:
+            return self.storage.save_world(snapshot)
+        return self.storage.save_changes(snapshot, snapshot.records, snapshot.deleted)
+
+    async def write_async(self, snapshot):
+        """Write a snapshot to storage in the storage executor, without blocking the event loop."""
+        storage = ExecutorStorage(self.storage)
+        if snapshot.full:
+            return await storage.save_world(snapshot)
+        return await storage.save_changes(snapshot, snapshot.records, snapshot.deleted)
+
+    def saved(self, snapshot, success, duration, pause):
+        stats = self.save_stats
+        stats.update(duration=duration, pause=pause, objects=len(snapshot.records) + len(snapshot.deleted))
         if success:
-            logger.info("World saved successfully")
+            stats["saves"] += 1
+            self.journal.truncate(snapshot.journal_segment)
+            logger.info(
+                "World %s saved in %.1fms, %.1fms of it on the event loop (%d objects)",
+                "snapshot" if snapshot.full else "changes",
+                duration * 1e3,
+                pause * 1e3,
+                stats["objects"],
+            )
+            if self.pager is not None:
+                # rooms with changes that were waiting on this save can be evicted now
+                self.pager.evict()
         else:
+            stats["failed"] += 1
+            # what this snapshot held is only on disk once the whole world is saved again
+            self.incremental_saves = None
+            # its objects count as changed again, so autosave tries once more, and in lazy mode,
+            # where there is no saving the whole world, the next save writes the same changes
+            for id in snapshot.records:
+                obj = self.contents.get(id)
+                if obj is not None:
+                    self.changed.setdefault(id, obj)
+            self.deleted.update(id for id in snapshot.deleted if id not in self.contents)
             logger.error("Failed to save world")
 
+    def save(self, _path=None, compact=False):
+        """Save the world now, blocking until it is written.
+
+        Code running on the event loop should await request_save() instead.
+        """
+        logger.info("Saving world using storage abstraction")
+        start = time.perf_counter()
+        snapshot = self.snapshot(compact)
+        if snapshot is None:
+            logger.info("No world changes to save")
+            return
+        pause = time.perf_counter() - start
+        success = self.write(snapshot)
+        self.saved(snapshot, success, time.perf_counter() - start, pause)
+
+    def request_save(self, compact=False):
+        """Save the world in the background, returning a task that ends once it's saved.
+
+        Only the snapshot is taken on the event loop; serializing and writing it
+        run in the storage executor (see write_async()). Requests made while a
+        save is running are coalesced into one more save when it finishes.
+        """
+        if self.saver is not None and not self.saver.done():
+            self.save_stats["coalesced"] += 1
+        self.save_requested = True
+        self.compact_requested = self.compact_requested or compact
+        if self.saver is None or self.saver.done():
+            self.saver = asyncio.get_running_loop().create_task(self.run_saves())
+        return self.saver
+
+    async def run_saves(self):
+        while self.save_requested:
+            compact = self.compact_requested
+            self.save_requested = self.compact_requested = False
+            # a failed save is counted and logged, and the next one tried, rather than ending the saver
+            try:
+                await self.save_in_background(compact)
+            except Exception:
+                self.save_stats["failed"] += 1
+                logger.exception("Failed to save world in the background")
+
+    async def save_in_background(self, compact):
+        start = time.perf_counter()
+        snapshot = self.snapshot(compact)
+        if snapshot is None:
+            return
+        pause = time.perf_counter() - start
+        self.writing = True
+        try:
+            success = await self.write_async(snapshot)
+        except Exception:
+            logger.exception("Failed to write world snapshot")
+            success = False
+        finally:
+            self.writing = False
+        self.saved(snapshot, success, time.perf_counter() - start, pause)
+
+    def start_autosave(self):
+        """Start saving the world every `autosave_interval` seconds (WORLD_AUTOSAVE_INTERVAL)."""
+        if self.autosave_interval > 0 and (self.autosaver is None or self.autosaver.done()):
+            self.autosaver = asyncio.get_running_loop().create_task(self.autosave())
+
+    async def autosave(self):
+        while True:
+            await asyncio.sleep(self.autosave_interval)
+            if self.changed or self.deleted:
+                await self.request_save()
+
+    def fetch(self, id):
+        """Return the object with the id, paging it in from storage in lazy mode."""
+        if self.pager is not None:
+            return self.pager.fetch(id)
+        return self.contents.get(id)
+
+    def find_room(self, name):
+        room = super().find_room(name)
+        if self.pager is not None:
+            if room is not None:
+                self.pager.used(room)
+            elif not name.startswith("@"):
+                room = self.pager.find_room(name)
+        return room
+
     def add(self, obj):
         if not hasattr(obj, "id"):
             raise ValueError
-        self.contents[obj.id] = obj
+        existing = self.contents.get(obj.id)
+        if existing is obj:
+            return
+        if existing is not None:
+            self.detach(existing)
+        self.attach(obj)
         obj.world = self
+        self.mark_changed(obj)
+        self.deleted.discard(obj.id)
+
+    def remove(self, obj):
+        super().remove(obj)
+        self.changed.pop(obj.id, None)
+        self.deleted.add(obj.id)
+        self.journal.delete(obj.id)
+
+    def mark_changed(self, obj):
+        self.changed[obj.id] = obj
+        self.journal.record(obj)
 
     def add_player(self, player):
         logger.info("Adding player to world: %s", player.name)
         self.add(player)
         if not player.location:
-            player.location = self.contents["0"]
-        player.location.contents[player.id] = player
+            player.location = self.fetch("0")
+        player.location.attach(player)
         logger.info("Player %s added to room: %s", player.name, player.location.id)
 
     def parse_command(self, player, line):
@@ -108,7 +389,11 @@ class World(Base):
             command.player.tell("I didn't understand that.")
             return
         logger.debug("Executing command: %s for player %s", command.verb, command.player.name)
-        func(command)
+        try:
+            func(command)
+        finally:
+            # journal what the command changed, tagged with the command itself
+            self.journal.flush(command)
 
     def find_function(self, command):
         search_path = [command.player, command.player.room]
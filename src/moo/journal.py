@@ -0,0 +1,184 @@
+import asyncio
+import contextlib
+import json
+import os
+from pathlib import Path
+
+from .logging_config import get_logger
+
+# Get logger for this module
+logger = get_logger("monkamoo.journal")
+
+
+class Journal:
+    """An append-only log of the world changes made since the last save.
+
+    Each entry holds the records of the objects changed by one command, or by
+    whatever else ran in an event-loop tick, so replaying the entries over the
+    last saved world restores every change that was journaled. Entries are
+    written as they happen and fsynced in batches every `fsync_interval`
+    seconds (JOURNAL_FSYNC_INTERVAL). A save starts a new segment file and
+    deletes the older ones once it has been written.
+    """
+
+    def __init__(self, path, fsync_interval=None, enabled=None):
+        path = Path(path)
+        # segments are named like world.journal.1.jsonl next to world.json
+        self.directory = path.parent
+        self.prefix = f"{path.stem}.journal."
+        self.fsync_interval = (
+            fsync_interval if fsync_interval is not None else float(os.getenv("JOURNAL_FSYNC_INTERVAL", "1"))
+        )
+        self.enabled = enabled if enabled is not None else os.getenv("WORLD_JOURNAL", "true").lower() == "true"
+        segments = self.segments()
+        self.segment = segments[-1][0] + 1 if segments else 1
+        self.pending = {}
+        self.deleted = set()
+        self.file = None
+        self.handle = None
+        self.syncing = None
+        self.entries = 0
+
+    def segments(self):
+        """Return the (number, path) of each segment on disk, oldest first."""
+        segments = []
+        for path in self.directory.glob(f"{self.prefix}*.jsonl"):
+            number = path.name[len(self.prefix) : -len(".jsonl")]
+            if number.isdigit():
+                segments.append((int(number), path))
+        return sorted(segments)
+
+    def record(self, obj):
+        if not self.enabled:
+            return
+        self.pending[obj.id] = obj
+        self.deleted.discard(obj.id)
+        self.schedule()
+
+    def delete(self, id):
+        if not self.enabled:
+            return
+        self.pending.pop(id, None)
+        self.deleted.add(id)
+        self.schedule()
+
+    def clear(self):
+        self.pending = {}
+        self.deleted = set()
+
+    def schedule(self):
+        if self.handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # without a loop, changes are written by the next command or save
+            return
+        self.handle = loop.call_soon(self.flush)
+
+    def flush(self, command=None):
+        """Append an entry for everything changed since the last one.
+
+        Returns the number of objects written.
+        """
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        if not self.enabled:
+            # turned off since the changes were recorded
+            self.clear()
+            return 0
+        if not self.pending and not self.deleted:
+            return 0
+        entry = {
+            "changed": {id: obj.json_dictionary() for id, obj in self.pending.items()},
+            "deleted": sorted(self.deleted),
+        }
+        if command is not None:
+            entry["command"] = command.line
+            entry["player"] = command.player.id
+        count = len(self.pending) + len(self.deleted)
+        self.clear()
+        try:
+            if self.file is None:
+                self.file = self.path(self.segment).open("a")
+            self.file.write(json.dumps(entry, sort_keys=True, separators=(",", ":")) + "\n")
+            self.file.flush()
+        except OSError:
+            logger.exception("Failed to write world journal")
+            return 0
+        self.entries += 1
+        if self.syncing is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self.sync_now()
+            else:
+                self.syncing = loop.call_later(self.fsync_interval, self.sync)
+        return count
+
+    def sync(self):
+        """Fsync the entries written since the last sync, in a worker thread."""
+        self.syncing = None
+        if self.file is not None:
+            asyncio.get_running_loop().run_in_executor(None, self.fsync, self.file.fileno())
+
+    def sync_now(self):
+        if self.file is not None:
+            self.fsync(self.file.fileno())
+
+    @staticmethod
+    def fsync(fd):
+        # the segment may have been closed by rotate(), which synced it itself
+        with contextlib.suppress(OSError):
+            os.fsync(fd)
+
+    def path(self, segment):
+        return self.directory / f"{self.prefix}{segment}.jsonl"
+
+    def rotate(self):
+        """Close the current segment and start a new one, for a save about to be taken.
+
+        Returns the first segment the save doesn't cover.
+        """
+        self.flush()
+        if self.file is not None:
+            self.sync_now()
+            self.file.close()
+            self.file = None
+            self.segment += 1
+        return self.segment
+
+    def truncate(self, segment):
+        """Delete the segments before `segment`, once a save covering them is written."""
+        for number, path in self.segments():
+            if number >= segment:
+                break
+            path.unlink(missing_ok=True)
+
+    def changes(self):
+        """Read back the journaled changes, to be applied over the world loaded from storage.
+
+        Returns:
+            Changed records by id, with None for objects since removed
+        """
+        changes = {}
+        applied = 0
+        for _, path in self.segments():
+            with path.open() as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # an entry cut short by a crash, and the end of what was written
+                        logger.warning("Ignoring incomplete journal entry in %s", path)
+                        break
+                    changes.update(entry["changed"])
+                    changes.update(dict.fromkeys(entry["deleted"]))
+                    applied += 1
+        if applied:
+            logger.info("Replaying %d journal entries", applied)
+        return changes
+
+    def stats(self):
+        return {"segment": self.segment, "entries": self.entries, "pending": len(self.pending) + len(self.deleted)}
@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+
 class Preposition:
 
     WITH = "with"
@@ -49,12 +52,60 @@ class Preposition:
 
     @classmethod
     def synonyms(cls, preposition):
-        return [s for s in cls.keys if cls.keys[s] == preposition]
+        return cls.phrases.get(preposition, [])
+
+    @classmethod
+    def reverse(cls):
+        """Map each preposition to the phrases that name it."""
+        phrases = {}
+        for phrase, preposition in cls.keys.items():
+            phrases.setdefault(preposition, []).append(phrase)
+        return phrases
+
+    @classmethod
+    def compile(cls):
+        """Build a word trie over the keys so multi-word prepositions match in one scan."""
+        trie = {}
+        for phrase, preposition in cls.keys.items():
+            node = trie
+            for word in phrase.split(" "):
+                node = node.setdefault(word, {})
+            node[None] = preposition
+        return trie
+
+    @classmethod
+    def match(cls, words, start):
+        """Return (preposition, word count) for the longest preposition at words[start].
+
+        The words must already be lowercase.
+        """
+        node = cls.trie
+        match = (None, 0)
+        for i in range(start, len(words)):
+            node = node.get(words[i])
+            if node is None:
+                break
+            if None in node:
+                match = (node[None], i - start + 1)
+        return match
+
+
+Preposition.trie = Preposition.compile()
+Preposition.phrases = Preposition.reverse()
 
 
 class Command:
 
-    def __init__(self, line, verb=None, direct_object_str=None, preposition=None, indirect_object_str=None):
+    def __init__(
+        self,
+        line,
+        verb=None,
+        direct_object_str=None,
+        preposition=None,
+        indirect_object_str=None,
+        *,
+        indirect_args=None,
+    ):
         self.player = None
         self.line = line
         self.verb = verb
@@ -71,17 +122,8 @@ class Command:
         else:
             self.args = None
             self.args_str = None
-
-        # indirect args
-        def get_remainder(string, word):
-            for prep in Preposition.synonyms(word):
-                index = string.find(prep)
-                if index == -1:
-                    continue
-                return string[index + len(prep) :].strip()
-            return None
-
-        self.indirect_args = preposition and get_remainder(line, preposition) or None
+        # the raw text after the preposition, articles and all
+        self.indirect_args = indirect_args
 
     def __repr__(self):
         return "<Command verb={verb} dobj={direct_object} prep={preposition} iobj={indirect_object}>".format(
@@ -112,11 +154,8 @@ class Command:
             if name.startswith("#"):
                 return world.find_room(name.strip("#"))
             if name.startswith("$"):
-                return world.contents.get(name.strip("$"))
-            for obj in list(player.contents.values()) + list(player.location.contents.values()):
-                if obj.name.lower() == name:
-                    return obj
-            return None
+                return world.fetch(name.strip("$"))
+            return player.lookup(name) or player.location.lookup(name)
 
         self.player = player
         self.direct_object = resolve_object(self.direct_object_str)
@@ -137,39 +176,64 @@ class Parser:
         put yellow bird in cuckoo clock
     """
 
-    articles = ["a", "an", "the"]
+    articles = frozenset(("a", "an", "the"))
 
     @classmethod
     def parse(cls, line):
         """Parse a line of text into a MOO command."""
         if not line:
             return None
-        # split line into words
-        words = line.strip(" .").split(" ")
-        words = [w for w in words if w.lower() not in Parser.articles]
-        if not words:
+        skeleton = cls.skeleton(line.strip(" ."))
+        if not skeleton:
             return None
+        verb, direct_object, preposition, indirect_object, end = skeleton
+        indirect_args = None
+        if end is not None:
+            start = len(line) - len(line.lstrip(" ."))
+            indirect_args = line[start + end :].strip() or None
+        return Command(line, verb, direct_object, preposition, indirect_object, indirect_args=indirect_args)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def skeleton(text):
+        """Return (verb, direct object, preposition, indirect object, end) for a normalized line.
+
+        `end` is the offset in text just past the preposition, or None without one.
+        Players and bots repeat the same commands constantly, so results are kept in
+        a bounded LRU cache keyed by the normalized text.
+        """
+        words = raw = text.split(" ")
+        lowered = text.lower().split(" ")
+        # the index in text of each word kept, only needed when there are articles to drop
+        positions = None
+        if not Parser.articles.isdisjoint(lowered):
+            positions = [i for i, word in enumerate(lowered) if word not in Parser.articles]
+            if not positions:
+                return None
+            words = [words[i] for i in positions]
+            lowered = [lowered[i] for i in positions]
         # verb is always the first word
-        verb = words[0].lower()
+        verb = lowered[0]
         if len(words) == 1:
-            return Command(line, verb)
-        # find preposition
-        i = 1
-        preposition = None
-        for w in words[1:]:
-            preposition = Preposition.keys.get(w.lower())
-            if preposition:
-                break
-            i += 1
-        # find objects
-        direct_object = None
-        indirect_object = None
-        if preposition:
-            direct_object = " ".join(words[1:i]) or None
-            indirect_object = " ".join(words[i + 1 :]) or None
+            return (verb, None, None, None, None)
+        # find preposition, preferring the longest phrase at each position
+        trie = Preposition.trie
+        for i in range(1, len(words)):
+            if lowered[i] in trie:
+                preposition, length = Preposition.match(lowered, i)
+                if preposition:
+                    break
         else:
-            direct_object = " ".join(words[1:])
-        return Command(line, verb, direct_object, preposition, indirect_object)
+            return (verb, " ".join(words[1:]), None, None, None)
+        # find objects
+        direct_object = " ".join(words[1:i]) or None
+        indirect_object = " ".join(words[i + length :]) or None
+        # the offset in text just past the preposition's last word
+        last = i + length - 1
+        if positions is not None:
+            last = positions[last]
+        end = len(" ".join(raw[: last + 1]))
+        return (verb, direct_object, preposition, indirect_object, end)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,187 @@
+"""
+On-demand paging of rooms for MonkaMOO.
+
+In lazy mode (WORLD_LAZY) a world starts with only its players and the rooms
+they are in. Any other room is read from an indexed store, together with
+everything in it, the first time it is needed. The least recently used rooms
+are evicted again once the world holds more objects than its budget.
+"""
+
+import os
+from collections import OrderedDict
+from itertools import islice
+
+from .core.base import Base
+from .logging_config import get_logger
+
+# Get logger for this module
+logger = get_logger("monkamoo.pager")
+
+
+def class_names(category):
+    """Return the names of the classes listed under a category, such as "rooms"."""
+    return [name for name, cls in Base.classes.items() if category in cls.categories]
+
+
+def descendants(obj):
+    """Yield an object and everything inside it, however deeply."""
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        yield obj
+        stack.extend(obj)
+
+
+class Pager:
+    """Pages a world's rooms in from storage on demand and evicts the least recently used.
+
+    A room is never evicted while a player is in it or while it, or anything
+    in it, has changes the world hasn't saved yet.
+    """
+
+    def __init__(self, world, budget=None):
+        self.world = world
+        # objects the world may hold before rooms are evicted
+        self.budget = budget if budget is not None else int(os.getenv("WORLD_RESIDENT_OBJECTS", "100000"))
+        # rooms in memory, least recently used first
+        self.rooms = OrderedDict()
+        self.stats = {"faults": 0, "evictions": 0}
+
+    def load(self):
+        """Page in the players and the rooms they are in, replacing objects already in the world.
+
+        Returns:
+            The number of objects paged in
+        """
+        world = self.world
+        storage = world.storage
+        changes = world.journal.changes()
+        if changes:
+            # apply the journal to storage, rather than holding the whole world to replay it over
+            changed = {id: record for id, record in changes.items() if record is not None}
+            deleted = [id for id, record in changes.items() if record is None]
+            if storage.save_changes(world, changed, deleted):
+                world.journal.truncate(world.journal.rotate())
+            else:
+                logger.error("Failed to apply %d journaled changes to storage", len(changes))
+        players = storage.load_objects(types=class_names("players"))
+        loaded = self.page_in({"0", *players}, replace=set(world.contents))
+        self.evict()
+        logger.info("World loaded lazily: %d objects, %d players", loaded, len(players))
+        return loaded
+
+    def fetch(self, id):
+        """Return the object with the id, paging it in if it isn't in memory."""
+        obj = self.world.contents.get(id)
+        if obj is None:
+            self.page_in({id})
+            obj = self.world.contents.get(id)
+        if obj is not None:
+            self.used(obj)
+            self.evict()
+        return obj
+
+    def find_room(self, name):
+        """Page in a room with the name, if storage has one."""
+        records = self.world.storage.load_objects(names=[name])
+        rooms = class_names("rooms")
+        for id, record in records.items():
+            if record["type"] in rooms:
+                return self.fetch(id)
+        return None
+
+    def page_in(self, ids, replace=()):
+        """Read objects from storage into the world, with the objects they are in and everything inside them.
+
+        Args:
+            ids: Ids of the objects to page in; those already in memory are skipped
+            replace: Ids of objects in memory to replace with what storage holds
+
+        Returns:
+            The number of objects paged in
+        """
+        world = self.world
+        storage = world.storage
+
+        def wanted(id):
+            return id not in world.contents or id in replace
+
+        records = storage.load_objects(ids=[id for id in ids if wanted(id)])
+        if not records:
+            return 0
+        # the locations the objects are in, up to their room
+        frontier = records
+        while frontier:
+            locations = {record.get("location") for record in frontier.values()}
+            frontier = storage.load_objects(ids=[id for id in locations if id and id not in records and wanted(id)])
+            records.update(frontier)
+        # and everything inside them
+        frontier = records
+        while frontier:
+            loaded = storage.load_objects(locations=list(frontier))
+            frontier = {id: record for id, record in loaded.items() if id not in records and wanted(id)}
+            records.update(frontier)
+
+        created = []
+        for record in records.values():
+            cls = Base.classes.get(record["type"])
+            if not cls:
+                logger.error("Class not found: %s", record["type"])
+                continue
+            existing = world.contents.get(record["id"])
+            if existing is not None:
+                world.detach(existing)
+            obj = cls(**{key: value for key, value in record.items() if key not in ("type", "location")})
+            world.attach(obj)
+            created.append((obj, record.get("location")))
+        # objects are linked before they join the world, so this isn't recorded as a change
+        for obj, location in created:
+            container = world.contents.get(location) if location else None
+            if container is not None:
+                obj.location = container
+                container.attach(obj)
+        for obj, _ in created:
+            obj.world = world
+            if obj.location is None and "rooms" in obj.categories:
+                self.rooms[obj.id] = obj
+        self.stats["faults"] += 1
+        logger.debug("Paged in %d objects", len(created))
+        return len(created)
+
+    def used(self, obj):
+        """Mark the room an object is in as the most recently used."""
+        room = obj.room
+        if room is not None:
+            self.rooms[room.id] = room
+            self.rooms.move_to_end(room.id)
+
+    def evict(self):
+        """Evict the least recently used rooms, with everything in them, until the world is within its budget.
+
+        The most recently used room is always kept, and nothing is evicted
+        while a save is being written, since storage won't have its changes yet.
+        """
+        world = self.world
+        if world.writing or len(world.contents) <= self.budget:
+            return
+        # rooms are only dropped from the LRU once it has been walked, from its cold end
+        gone = []
+        for id, room in islice(self.rooms.items(), len(self.rooms) - 1):
+            if len(world.contents) <= self.budget:
+                break
+            if world.contents.get(id) is not room:
+                # removed from the world since
+                gone.append(id)
+                continue
+            objects = list(descendants(room))
+            if any("players" in obj.categories or obj.id in world.changed for obj in objects):
+                continue
+            for obj in objects:
+                world.detach(obj)
+                # anything still holding on to the object can no longer change the world through it
+                obj.world = None
+            gone.append(id)
+            self.stats["evictions"] += 1
+            logger.debug("Evicted room %s with %d objects", id, len(objects))
+        for id in gone:
+            del self.rooms[id]
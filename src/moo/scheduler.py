@@ -0,0 +1,150 @@
+import asyncio
+import os
+import time
+from collections import deque
+
+from .logging_config import get_logger
+
+# Get logger for this module
+logger = get_logger("monkamoo.scheduler")
+
+# Number of recent queue wait times kept for percentiles
+WAIT_SAMPLES = 1000
+
+
+class TokenBucket:
+    """Allows `rate` commands per second on average, in bursts of up to `burst`."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self):
+        """Take a token, returning 0, or return the seconds until one is available."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+
+class CommandScheduler:
+    """Runs player commands fairly, one at a time, from a single task.
+
+    Each player has a bounded queue of pending commands and a token bucket. The
+    scheduler takes one command per player in round-robin order, skipping players
+    who are out of tokens until they refill, and yields to the event loop between
+    commands so a flooding client or bot can't starve everyone else. Limits come
+    from COMMAND_RATE, COMMAND_BURST and COMMAND_QUEUE_SIZE.
+    """
+
+    def __init__(self, world, rate=None, burst=None, queue_size=None):
+        self.world = world
+        self.rate = rate if rate is not None else float(os.getenv("COMMAND_RATE", "10"))
+        self.burst = burst if burst is not None else float(os.getenv("COMMAND_BURST", "20"))
+        self.queue_size = queue_size if queue_size is not None else int(os.getenv("COMMAND_QUEUE_SIZE", "50"))
+        self.queues = {}
+        self.buckets = {}
+        self.ready = deque()
+        self.scheduled = set()
+        self.wakeup = asyncio.Event()
+        self.task = None
+        self.executed = 0
+        self.dropped = 0
+        self.throttled = 0
+        self.waits = deque(maxlen=WAIT_SAMPLES)
+
+    def submit(self, player, command, future=None):
+        """Queue a command line, or a callable, to run for the player.
+
+        Returns False if their queue is full, telling the player unless a future
+        is waiting on the command.
+        """
+        queue = self.queues.setdefault(player.id, deque())
+        if len(queue) >= self.queue_size:
+            self.dropped += 1
+            logger.debug("Dropped command for player %s: queue full", player.name)
+            if future is None:
+                player.tell("You are sending commands too fast. Slow down!")
+            return False
+        queue.append((command, future, time.monotonic()))
+        if player.id not in self.scheduled:
+            self.scheduled.add(player.id)
+            self.ready.append(player)
+            self.wakeup.set()
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self.run())
+        return True
+
+    async def execute(self, player, command):
+        """Queue a command and wait for it to run, returning the callable's result."""
+        future = asyncio.get_running_loop().create_future()
+        if not self.submit(player, command, future):
+            return None
+        return await future
+
+    def unpark(self, player):
+        self.ready.append(player)
+        self.wakeup.set()
+
+    async def run(self):
+        while True:
+            if not self.ready:
+                self.wakeup.clear()
+                await self.wakeup.wait()
+                continue
+            player = self.ready.popleft()
+            bucket = self.buckets.get(player.id)
+            if bucket is None:
+                bucket = self.buckets[player.id] = TokenBucket(self.rate, self.burst)
+            delay = bucket.take()
+            if delay:
+                # park the player until their bucket has a token again
+                self.throttled += 1
+                asyncio.get_running_loop().call_later(delay, self.unpark, player)
+                continue
+            queue = self.queues[player.id]
+            command, future, queued_at = queue.popleft()
+            self.waits.append(time.monotonic() - queued_at)
+            self.perform(player, command, future)
+            if queue:
+                self.ready.append(player)
+            else:
+                del self.queues[player.id]
+                self.scheduled.discard(player.id)
+            # let I/O and other tasks run between commands
+            await asyncio.sleep(0)
+
+    def perform(self, player, command, future):
+        self.executed += 1
+        try:
+            result = command() if callable(command) else self.world.parse_command(player, command)
+        except Exception as e:
+            logger.exception("Command failed for player %s: %s", player.name, command)
+            if future and not future.done():
+                future.set_exception(e)
+            return
+        if future and not future.done():
+            future.set_result(result)
+
+    def stats(self):
+        """Return command counts and queue wait times (seconds) over recent commands."""
+        waits = sorted(self.waits)
+
+        def percentile(p):
+            return waits[min(len(waits) - 1, int(len(waits) * p))] if waits else 0.0
+
+        return {
+            "executed": self.executed,
+            "dropped": self.dropped,
+            "throttled": self.throttled,
+            "queued": sum(len(queue) for queue in self.queues.values()),
+            "players": len(self.queues),
+            "wait_p50": percentile(0.5),
+            "wait_p99": percentile(0.99),
+            "wait_max": waits[-1] if waits else 0.0,
+        }
@@ -1,42 +1,198 @@
 #!/usr/bin/env python3
 
 import asyncio
+import os
 
 from . import shell
+from .connections import ConnectionRegistry
 from .logging_config import get_logger
 
 # Get logger for this module
 logger = get_logger("monkamoo.server")
 
+# What to do with a telnet client whose held-back output exceeds its budget
+DROP = "drop"
+TRUNCATE = "truncate"
+DISCONNECT = "disconnect"
+OVERFLOW_POLICIES = (DROP, TRUNCATE, DISCONNECT)
+
+TRUNCATED = b"[output truncated]\n"
+
 
 class StreamReaderWrapper:
-    def __init__(self, reader):
+    def __init__(self, reader, connection=None):
         self.reader = reader
+        self.connection = connection
 
     async def async_readline(self):
         data = await self.reader.readline()
+        if data and self.connection:
+            self.connection.received(data)
         return data.decode()
 
 
+class OutputBatch:
+    """Telnet outputs with buffered data, all sent once at the end of the event-loop tick."""
+
+    def __init__(self):
+        self.pending = []
+        self.handle = None
+
+    def add(self, output):
+        self.pending.append(output)
+        if self.handle is None:
+            self.handle = asyncio.get_running_loop().call_soon(self.send)
+
+    def send(self):
+        outputs = self.pending
+        self.pending = []
+        self.handle = None
+        for output in outputs:
+            output.queued = False
+            output.send()
+
+
 class StreamWriterWrapper:
-    def __init__(self, writer):
+    """Buffered, flow-controlled output to a telnet client.
+
+    Lines written during an event-loop tick are coalesced and handed to the
+    transport together, along with the output of every client in the same
+    `batch`. While the transport holds more than `high` bytes the output is
+    held back until the client drains it below `low`. Output held back
+    beyond `limit` bytes is handled by `policy`: "drop" drops new output until
+    the client catches up, "truncate" drops the older queued output, and
+    "disconnect" closes the connection. Defaults come from TELNET_WRITE_HIGH,
+    TELNET_WRITE_LOW, TELNET_OUTPUT_LIMIT and TELNET_OVERFLOW.
+    """
+
+    def __init__(self, writer, *, high=None, low=None, limit=None, policy=None, connection=None, batch=None):
         self.writer = writer
+        self.connection = connection
+        self.batch = batch if batch is not None else OutputBatch()
+        self.high = high if high is not None else int(os.getenv("TELNET_WRITE_HIGH", "65536"))
+        self.low = low if low is not None else int(os.getenv("TELNET_WRITE_LOW", "16384"))
+        self.limit = limit if limit is not None else int(os.getenv("TELNET_OUTPUT_LIMIT", "1048576"))
+        self.policy = (policy or os.getenv("TELNET_OVERFLOW", TRUNCATE)).lower()
+        if self.policy not in OVERFLOW_POLICIES:
+            msg = f"Unknown telnet overflow policy: {self.policy}"
+            raise ValueError(msg)
+        self.chunks = []
+        self.buffered = 0
+        self.dropped = 0
+        self.skipped = 0
+        self.closed = False
+        self.queued = False
+        self.drainer = None
+        transport = getattr(writer, "transport", None)
+        if transport:
+            transport.set_write_buffer_limits(high=self.high, low=self.low)
 
     def write(self, data):
         if isinstance(data, str):
             data = data.encode()
-        self.writer.write(data)
+        self.write_bytes(data)
+
+    def write_bytes(self, data):
+        if self.closed:
+            return
+        if self.buffered + len(data) > self.limit:
+            self.overflow(data)
+            return
+        self.chunks.append(data)
+        self.buffered += len(data)
+        self.schedule()
 
     def flush(self):
+        # buffered lines go out together at the end of the tick
         pass
 
+    @staticmethod
+    def write_many(outputs, data):
+        """Write the same data to several clients, encoding it only once."""
+        if isinstance(data, str):
+            data = data.encode()
+        for output in outputs:
+            output.write_bytes(data)
+
+    def overflow(self, data):
+        if self.policy == DISCONNECT:
+            logger.warning("Telnet client exceeded its output budget, disconnecting")
+            self.close()
+        elif self.policy == DROP:
+            self.dropped += len(data)
+            self.skipped += len(data)
+        else:
+            self.dropped += self.buffered
+            self.chunks = [TRUNCATED, data]
+            self.buffered = len(TRUNCATED) + len(data)
+            self.schedule()
+
+    @property
+    def paused(self):
+        return self.drainer is not None
+
+    def schedule(self):
+        if self.queued or self.paused:
+            return
+        self.queued = True
+        self.batch.add(self)
+
+    def send(self):
+        if self.closed or not self.chunks:
+            return
+        if self.skipped:
+            self.chunks.insert(0, f"[{self.skipped} bytes of output skipped]\n".encode())
+            self.skipped = 0
+        self.writer.writelines(self.chunks)
+        if self.connection:
+            self.connection.sent(sum(map(len, self.chunks)))
+        self.chunks = []
+        self.buffered = 0
+        transport = self.writer.transport
+        if transport and transport.get_write_buffer_size() > self.high:
+            self.drainer = asyncio.get_running_loop().create_task(self.wait_for_drain())
+
+    async def wait_for_drain(self):
+        try:
+            await self.writer.drain()
+        except ConnectionError:
+            self.close()
+            return
+        finally:
+            self.drainer = None
+        self.schedule()
+
+    async def drain(self):
+        """Wait until the client has caught up with its output."""
+        if self.drainer is not None:
+            await asyncio.shield(self.drainer)
+
+    def stats(self):
+        """Return the bytes held here and in the transport, and total bytes dropped."""
+        transport = self.writer.transport
+        return {
+            "buffered": self.buffered,
+            "transport": transport.get_write_buffer_size() if transport else 0,
+            "dropped": self.dropped,
+            "paused": self.paused,
+        }
+
+    def close(self):
+        self.closed = True
+        self.chunks = []
+        self.buffered = 0
+        self.writer.close()
+
 
 class MonkaMOOServer:
-    clients = []
-
-    def __init__(self, world):
+    def __init__(self, world, idle_timeout=None):
         self.world = world
         self.server = None
+        self.connections = ConnectionRegistry()
+        # output for every client is sent together at the end of each tick
+        self.outputs = OutputBatch()
+        # seconds without input before a client is disconnected, 0 to never
+        self.idle_timeout = idle_timeout if idle_timeout is not None else float(os.getenv("TELNET_IDLE_TIMEOUT", "0"))
 
     async def start_server(self):
         self.server = await asyncio.start_server(self.handle_client, "0.0.0.0", 8888)
@@ -46,29 +202,46 @@ class MonkaMOOServer:
     async def handle_client(self, reader, writer):
         client_addr = writer.get_extra_info("peername")
         logger.info("Telnet client connected: %s", client_addr)
-        self.clients.append(writer)
+        connection = self.connections.add(client_addr, writer)
 
         try:
             # wrap the reader and writer
-            wrapped_reader = StreamReaderWrapper(reader)
-            wrapped_writer = StreamWriterWrapper(writer)
+            wrapped_reader = StreamReaderWrapper(reader, connection=connection)
+            wrapped_writer = StreamWriterWrapper(writer, connection=connection, batch=self.outputs)
+            connection.output = wrapped_writer
 
             # run shell command loop
-            client_shell = shell.Shell(self.world, stdin=wrapped_reader, stdout=wrapped_writer)
+            client_shell = shell.Shell(
+                self.world,
+                stdin=wrapped_reader,
+                stdout=wrapped_writer,
+                connection=connection,
+            )
             await client_shell.cmdloop()
         except Exception:
             logger.exception("Telnet client error for %s", client_addr)
         finally:
             # close connection
-            self.clients.remove(writer)
+            self.connections.remove(connection)
             writer.close()
             logger.info("Telnet client disconnected: %s", client_addr)
 
+    async def reap_idle(self):
+        while True:
+            await asyncio.sleep(min(self.idle_timeout, 60))
+            self.connections.reap(self.idle_timeout)
+
     async def run(self):
         await self.start_server()
         logger.info("Telnet server running, waiting for connections...")
-        async with self.server:
-            await self.server.serve_forever()
+        self.world.start_autosave()
+        reaper = asyncio.create_task(self.reap_idle()) if self.idle_timeout > 0 else None
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            if reaper:
+                reaper.cancel()
 
     def stop(self):
         if self.server:
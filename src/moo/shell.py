@@ -1,4 +1,5 @@
 import asyncio
+import os
 import sys
 from concurrent.futures import ThreadPoolExecutor
 
@@ -16,20 +17,34 @@ class Shell:
     intro = "Welcome to MonkaMOO!"
     player = None
 
-    def __init__(self, world, player=None, stdin=sys.stdin, stdout=sys.stdout, loop=None):
+    # shared by every shell reading from a blocking stdin; async sources never use it
+    executor = None
+
+    def __init__(self, world, player=None, stdin=sys.stdin, stdout=sys.stdout, loop=None, *, connection=None):
         self.world = world
         self.stdin = stdin
         self.stdout = stdout
+        self.connection = connection
         self.loop = loop or asyncio.get_event_loop()
-        self.executor = ThreadPoolExecutor()
         self.set_player(player)
         self.stdout.write(self.intro + "\n")
         logger.info("Shell initialized for world: %s", world.path)
 
+    @staticmethod
+    def get_executor():
+        if Shell.executor is None:
+            Shell.executor = ThreadPoolExecutor(
+                max_workers=int(os.getenv("SHELL_INPUT_THREADS", "4")),
+                thread_name_prefix="shell-input",
+            )
+        return Shell.executor
+
     def set_player(self, player):
         if self.player:
             self.player.stdout = None
         self.player = player
+        if self.connection:
+            self.connection.bind(player)
         if self.player:
             self.player.stdout = self.stdout
             logger.info("Shell player set to: %s", player.name)
@@ -49,10 +64,13 @@ class Shell:
         logger.info("Shell command loop ended")
 
     async def get_input(self):
+        if hasattr(self.stdout, "drain"):
+            # take no more commands from a client that isn't reading its output
+            await self.stdout.drain()
         if hasattr(self.stdin, "async_readline"):
             line = await self.stdin.async_readline()
         else:
-            line = await self.loop.run_in_executor(self.executor, self.stdin.readline)
+            line = await self.loop.run_in_executor(self.get_executor(), self.stdin.readline)
         if not line:
             raise EOFError
         return line.strip()
@@ -74,11 +92,13 @@ class Shell:
             return await self.do_player(None)
         if line:
             logger.debug("Shell parsing command for player %s: %s", self.player.name if self.player else "None", line)
-            self.world.parse_command(self.player, line)
+            self.world.scheduler.submit(self.player, line)
         return None
 
     async def do_interact(self, _arg):
         globals().update(((p.name.lower()), p) for p in self.world.players)
+        if self.connection:
+            globals()["connections"] = self.connection.registry
         interpreter.interact(local=globals(), stdin=self.stdin, stdout=self.stdout)
 
     async def do_player(self, arg):
@@ -2,12 +2,30 @@
 Storage abstraction layer for MonkaMOO.
 
 This module provides a unified interface for storing world state and AI player history
-across different environments (local files, cloud storage, etc.).
+across different environments (local files, SQLite, cloud storage, etc.).
 """
 
 from .cloud import CloudStorage
+from .executor import ExecutorStorage
 from .factory import get_storage, get_storage_with_fallback
-from .interface import StorageInterface
+from .interface import (
+    AsyncStorageInterface,
+    IncrementalStorage,
+    IndexedStorage,
+    StorageInterface,
+)
 from .local import LocalFileStorage
+from .sqlite import SQLiteStorage
 
-__all__ = ["StorageInterface", "LocalFileStorage", "CloudStorage", "get_storage", "get_storage_with_fallback"]
+__all__ = [
+    "StorageInterface",
+    "IncrementalStorage",
+    "IndexedStorage",
+    "AsyncStorageInterface",
+    "ExecutorStorage",
+    "LocalFileStorage",
+    "CloudStorage",
+    "SQLiteStorage",
+    "get_storage",
+    "get_storage_with_fallback",
+]
@@ -4,6 +4,8 @@ Cloud storage implementation for MonkaMOO using AWS S3.
 Provides S3-based storage for Heroku deployment.
 """
 
+import gzip
+import hashlib
 import json
 import os
 
@@ -11,24 +13,52 @@ import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from ..logging_config import get_logger
+from . import snapshot
 from .interface import StorageInterface
 
 # Get logger for this module
 logger = get_logger("monkamoo.storage.cloud")
 
+# body compressions storage can be configured with (CLOUD_COMPRESSION)
+COMPRESSIONS = ("gzip", "none")
+GZIP_MAGIC = b"\x1f\x8b"
+# JSON compresses nearly as well at the fastest level, in a tenth of the time of the default
+GZIP_LEVEL = 1
+
 
 class CloudStorage(StorageInterface):
     """AWS S3-based cloud storage implementation."""
 
-    def __init__(self, bucket_name: str = None, region: str = None):
+    def __init__(
+        self,
+        bucket_name: str = None,
+        region: str = None,
+        world_format: str | None = None,
+        compression: str | None = None,
+    ):
         """Initialize cloud storage with S3.
 
         Args:
             bucket_name: S3 bucket name (defaults to environment variable)
             region: AWS region (defaults to environment variable)
+            world_format: 'json', or 'binary' for a compact snapshot stored as
+                world.moo (defaults to environment variable)
+            compression: 'gzip' to upload compressed bodies, or 'none'
+                (defaults to environment variable)
         """
         self.bucket_name = bucket_name or os.getenv("CLOUD_STORAGE_BUCKET")
         self.region = region or os.getenv("AWS_REGION", "us-east-1")
+        self.world_format = (world_format or os.getenv("WORLD_FORMAT", snapshot.JSON)).lower()
+        if self.world_format not in snapshot.FORMATS:
+            msg = f"Unknown world format: {self.world_format}"
+            raise ValueError(msg)
+        self.compression = (compression or os.getenv("CLOUD_COMPRESSION", "gzip")).lower()
+        if self.compression not in COMPRESSIONS:
+            msg = f"Unknown compression: {self.compression}"
+            raise ValueError(msg)
+        # hash of the body last uploaded or downloaded for each key, so unchanged bodies aren't uploaded again
+        self.hashes = {}
+        self.upload_stats = {"uploads": 0, "skipped": 0, "bytes": 0, "uncompressed_bytes": 0}
 
         if not self.bucket_name:
             msg = "CLOUD_STORAGE_BUCKET environment variable is required"
@@ -44,32 +74,68 @@ class CloudStorage(StorageInterface):
 
         logger.info("CloudStorage initialized: bucket=%s, region=%s", self.bucket_name, self.region)
 
-    def _get_world_key(self) -> str:
+    def _get_world_key(self, world_format: str | None = None) -> str:
         """Get S3 key for world state."""
-        return "world.json"
+        return "world.moo" if (world_format or self.world_format) == snapshot.BINARY else "world.json"
 
     def _get_ai_history_key(self, player_name: str) -> str:
         """Get S3 key for AI player history."""
         return f"bots/{player_name}.json"
 
+    def _put_object(self, key: str, body: bytes, content_type: str) -> bool:
+        """Upload a body, compressed, unless it is the same as the last one uploaded or downloaded for the key.
+
+        Returns:
+            True if the body was uploaded, False if it was unchanged
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        if self.hashes.get(key) == digest:
+            logger.debug("Skipping upload of unchanged object to S3: bucket=%s, key=%s", self.bucket_name, key)
+            self.upload_stats["skipped"] += 1
+            return False
+        size = len(body)
+        extra = {}
+        if self.compression == "gzip":
+            # a fixed mtime keeps the same body compressing to the same bytes
+            body = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+            extra["ContentEncoding"] = "gzip"
+        self.s3_client.put_object(Bucket=self.bucket_name, Key=key, Body=body, ContentType=content_type, **extra)
+        self.hashes[key] = digest
+        stats = self.upload_stats
+        stats["uploads"] += 1
+        stats["bytes"] += len(body)
+        stats["uncompressed_bytes"] += size
+        return True
+
+    def _get_object(self, key: str) -> bytes:
+        """Download a body, decompressing it if it was uploaded compressed."""
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+        body = response["Body"].read()
+        # objects uploaded before compression have no ContentEncoding, and no gzip header
+        if response.get("ContentEncoding") == "gzip" or body[:2] == GZIP_MAGIC:
+            body = gzip.decompress(body)
+        self.hashes[key] = hashlib.sha256(body).hexdigest()
+        return body
+
     def save_world(self, world) -> bool:
         try:
             key = self._get_world_key()
-            data = json.dumps(
-                world,
-                default=lambda o: o.json_dictionary(),
-                sort_keys=True,
-                indent=2,
-                separators=(",", ": "),
-            )
+            if self.world_format == snapshot.BINARY:
+                body = snapshot.dumps(world)
+                content_type = "application/octet-stream"
+            else:
+                data = json.dumps(
+                    world,
+                    default=lambda o: o.json_dictionary(),
+                    sort_keys=True,
+                    indent=2,
+                    separators=(",", ": "),
+                )
+                body = data.encode("utf-8")
+                content_type = "application/json"
             logger.debug("Saving world to S3: bucket=%s, key=%s", self.bucket_name, key)
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=data.encode("utf-8"),
-                ContentType="application/json",
-            )
-            logger.info("World saved successfully to S3")
+            if self._put_object(key, body, content_type):
+                logger.info("World saved successfully to S3")
         except (ClientError, NoCredentialsError):
             logger.exception("Failed to save world to S3")
             return False
@@ -83,12 +149,19 @@ class CloudStorage(StorageInterface):
         try:
             key = self._get_world_key()
             logger.debug("Loading world from S3: bucket=%s, key=%s", self.bucket_name, key)
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-            data = response["Body"].read().decode("utf-8")
-            if not data:
+            try:
+                body = self._get_object(key)
+            except ClientError as e:
+                if self.world_format != snapshot.BINARY or e.response["Error"]["Code"] != "NoSuchKey":
+                    raise
+                # no snapshot saved yet, so start from the JSON world
+                key = self._get_world_key(snapshot.JSON)
+                logger.debug("Loading world from S3: bucket=%s, key=%s", self.bucket_name, key)
+                body = self._get_object(key)
+            if not body:
                 logger.warning("World data is empty in S3")
                 return None
-            world_data = json.loads(data)
+            world_data = snapshot.loads(body) if key.endswith(".moo") else json.loads(body.decode("utf-8"))
             logger.info("World loaded successfully from S3")
         except ClientError as e:
             if e.response["Error"]["Code"] == "NoSuchKey":
@@ -107,13 +180,8 @@ class CloudStorage(StorageInterface):
             key = self._get_ai_history_key(player_name)
             data = json.dumps(history, indent=2, separators=(",", ": "))
             logger.debug("Saving AI history for %s to S3: bucket=%s, key=%s", player_name, self.bucket_name, key)
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=data.encode("utf-8"),
-                ContentType="application/json",
-            )
-            logger.debug("AI history saved successfully for %s to S3", player_name)
+            if self._put_object(key, data.encode("utf-8"), "application/json"):
+                logger.debug("AI history saved successfully for %s to S3", player_name)
         except (ClientError, NoCredentialsError):
             logger.exception("Failed to save AI history for %s to S3", player_name)
             return False
@@ -127,8 +195,7 @@ class CloudStorage(StorageInterface):
         try:
             key = self._get_ai_history_key(player_name)
             logger.debug("Loading AI history for %s from S3: bucket=%s, key=%s", player_name, self.bucket_name, key)
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-            data = response["Body"].read().decode("utf-8")
+            data = self._get_object(key).decode("utf-8")
             history = json.loads(data)
             logger.debug("AI history loaded successfully for %s from S3", player_name)
         except ClientError as e:
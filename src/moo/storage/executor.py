@@ -0,0 +1,77 @@
+"""
+Async storage adapter for MonkaMOO.
+
+Runs the methods of any StorageInterface implementation, such as local files,
+SQLite or S3, in a bounded pool of worker threads, so that waiting on disk or
+the network never holds up the event loop that serves every player.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from ..logging_config import get_logger
+from .interface import AsyncStorageInterface, StorageInterface
+
+# Get logger for this module
+logger = get_logger("monkamoo.storage.executor")
+
+
+class ExecutorStorage(AsyncStorageInterface):
+    """Async adapter that runs a storage implementation's methods in the storage executor.
+
+    The executor is one thread pool of STORAGE_WORKERS threads shared by every
+    adapter, so slow storage can't tie up more threads than that.
+    """
+
+    # created on first use
+    executor = None
+
+    def __init__(self, storage: StorageInterface):
+        """Initialize the adapter.
+
+        Args:
+            storage: Storage implementation to run
+        """
+        self.storage = storage
+        # saves of one player's history are written in the order they were made
+        self.history_locks = {}
+
+    @property
+    def sync(self) -> StorageInterface:
+        """The storage itself, for code with no event loop to hold up, such as loading the world at startup."""
+        return self.storage
+
+    @staticmethod
+    def get_executor() -> ThreadPoolExecutor:
+        if ExecutorStorage.executor is None:
+            workers = int(os.getenv("STORAGE_WORKERS", "4"))
+            ExecutorStorage.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="storage")
+            logger.info("Storage executor started with %d workers", workers)
+        return ExecutorStorage.executor
+
+    async def run(self, method, *args):
+        return await asyncio.get_running_loop().run_in_executor(ExecutorStorage.get_executor(), method, *args)
+
+    async def save_world(self, world) -> bool:
+        return await self.run(self.storage.save_world, world)
+
+    async def save_changes(self, world, changed: dict[str, dict], deleted: list[str]) -> bool:
+        return await self.run(self.storage.save_changes, world, changed, deleted)
+
+    async def load_world(self) -> dict | None:
+        return await self.run(self.storage.load_world)
+
+    async def save_ai_history(self, player_name: str, history: list[dict]) -> bool:
+        lock = self.history_locks.setdefault(player_name, asyncio.Lock())
+        async with lock:
+            return await self.run(self.storage.save_ai_history, player_name, history)
+
+    async def load_ai_history(self, player_name: str) -> list[dict] | None:
+        return await self.run(self.storage.load_ai_history, player_name)
+
+    async def list_ai_players(self) -> list[str]:
+        return await self.run(self.storage.list_ai_players)
+
+    async def health_check(self) -> bool:
+        return await self.run(self.storage.health_check)
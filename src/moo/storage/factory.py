@@ -10,6 +10,7 @@ from ..logging_config import get_logger
 from .cloud import CloudStorage
 from .interface import StorageInterface
 from .local import LocalFileStorage
+from .sqlite import SQLiteStorage
 
 # Get logger for this module
 logger = get_logger("monkamoo.storage.factory")
@@ -38,6 +39,9 @@ def get_storage(world_path: str = "world.json", bots_dir: str = "bots") -> Stora
     if storage_type == "heroku":
         logger.info("Using cloud storage for Heroku")
         return CloudStorage()
+    if storage_type == "sqlite":
+        logger.info("Using SQLite storage")
+        return SQLiteStorage(world_path=world_path, bots_dir=bots_dir)
     logger.warning("Unknown storage type '%s', falling back to local", storage_type)
     return LocalFileStorage(world_path=world_path, bots_dir=bots_dir)
 
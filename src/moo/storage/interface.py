@@ -5,17 +5,26 @@ Defines the contract that all storage implementations must follow.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 
 
 class StorageInterface(ABC):
     """Abstract base class for storage implementations."""
 
+    # whether save_changes() can store changes apart from the snapshot (see IncrementalStorage)
+    incremental = False
+    # whether load_objects() can read part of the world without loading all of it (see IndexedStorage)
+    indexed = False
+    # whether save_changes() updates the saved objects in place, so what was
+    # loaded is what is saved and changes never need folding into a snapshot
+    in_place = False
+
     @abstractmethod
     def save_world(self, world) -> bool:
         """Save world state data.
 
         Args:
-            world: World object to save
+            world: World, or snapshot of one, to save
 
         Returns:
             True if save was successful, False otherwise
@@ -23,12 +32,26 @@ class StorageInterface(ABC):
 
     @abstractmethod
     def load_world(self) -> dict | None:
-        """Load world state data.
+        """Load world state data, including changes saved since the snapshot.
 
         Returns:
             World data dictionary if successful, None otherwise
         """
 
+    def stream_world(self) -> tuple[int | None, Iterator[dict]] | None:
+        """Load world state data one object at a time.
+
+        Storage that can't read objects incrementally loads all of them first.
+
+        Returns:
+            The world's generation and an iterator over its object records,
+            with saved changes applied, or None if there is no world
+        """
+        world_data = self.load_world()
+        if not world_data:
+            return None
+        return world_data.get("generation"), iter(world_data.get("contents", {}).values())
+
     @abstractmethod
     def save_ai_history(self, player_name: str, history: list[dict]) -> bool:
         """Save AI player conversation history.
@@ -67,3 +90,84 @@ class StorageInterface(ABC):
         Returns:
             True if storage is healthy, False otherwise
         """
+
+
+class IncrementalStorage(StorageInterface):
+    """Storage that can save the objects changed since a save without saving the whole world again."""
+
+    incremental = True
+
+    @abstractmethod
+    def save_changes(self, world, changed: dict[str, dict], deleted: list[str]) -> bool:
+        """Save the objects changed since the world was last saved.
+
+        Args:
+            world: World, or snapshot of one, being saved
+            changed: Serialized objects added or changed since the last save, by id
+            deleted: Ids of objects removed since the last save
+
+        Returns:
+            True if save was successful, False otherwise
+        """
+
+
+class IndexedStorage(StorageInterface):
+    """Storage that can load some of the world's objects without loading all of them."""
+
+    indexed = True
+
+    @abstractmethod
+    def load_objects(
+        self,
+        ids: Iterable[str] | None = None,
+        locations: Iterable[str] | None = None,
+        types: Iterable[str] | None = None,
+        names: Iterable[str] | None = None,
+    ) -> dict[str, dict]:
+        """Load some of the world's objects, including changes saved since the snapshot.
+
+        Args:
+            ids: Ids of the objects to load
+            locations: Ids of locations whose contents to load
+            types: Class names of the objects to load
+            names: Names of the objects to load, ignoring case
+
+        Returns:
+            Object records by id, for objects matching any of the arguments
+        """
+
+
+class AsyncStorageInterface(ABC):
+    """Abstract base class for storage whose methods can be awaited on the event loop.
+
+    Each method does what the StorageInterface method of the same name does,
+    without blocking the event loop while it waits on files or the network.
+    """
+
+    @abstractmethod
+    async def save_world(self, world) -> bool:
+        """Save world state data. See StorageInterface.save_world."""
+
+    @abstractmethod
+    async def save_changes(self, world, changed: dict[str, dict], deleted: list[str]) -> bool:
+        """Save the objects changed since the world was last saved. See StorageInterface.save_changes."""
+
+    @abstractmethod
+    async def load_world(self) -> dict | None:
+        """Load world state data. See StorageInterface.load_world."""
+
+    @abstractmethod
+    async def save_ai_history(self, player_name: str, history: list[dict]) -> bool:
+        """Save AI player conversation history. See StorageInterface.save_ai_history."""
+
+    @abstractmethod
+    async def load_ai_history(self, player_name: str) -> list[dict] | None:
+        """Load AI player conversation history. See StorageInterface.load_ai_history."""
+
+    @abstractmethod
+    async def list_ai_players(self) -> list[str]:
+        """List all available AI players. See StorageInterface.list_ai_players."""
+
+    @abstractmethod
+    async def health_check(self) -> bool:
+        """Check if storage is healthy and accessible. See StorageInterface.health_check."""
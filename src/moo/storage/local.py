@@ -5,26 +5,52 @@ Provides file-based storage for local development and testing.
 """
 
 import json
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
 from ..logging_config import get_logger
-from .interface import StorageInterface
+from . import snapshot
+from .interface import IncrementalStorage
+from .stream import iter_records, overlay, read_generation
 
 # Get logger for this module
 logger = get_logger("monkamoo.storage.local")
 
 
-class LocalFileStorage(StorageInterface):
+def write_atomically(path: Path, data: str | bytes) -> None:
+    """Write a file by writing a temporary one next to it and moving it into place.
+
+    A save interrupted part way through leaves the previous file intact.
+    """
+    temporary = path.with_name(f"{path.name}.tmp")
+    with temporary.open("wb" if isinstance(data, bytes) else "w") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    temporary.replace(path)
+
+
+class LocalFileStorage(IncrementalStorage):
     """Local file-based storage implementation."""
 
-    def __init__(self, world_path: str = "world.json", bots_dir: str = "bots"):
+    def __init__(self, world_path: str = "world.json", bots_dir: str = "bots", world_format: str | None = None):
         """Initialize local file storage.
 
         Args:
             world_path: Path to world state file
             bots_dir: Directory containing AI player history files
+            world_format: 'json', or 'binary' for a compact snapshot next to
+                world_path with a .moo suffix (defaults to environment variable)
         """
         self.world_path = Path(world_path)
+        self.world_format = (world_format or os.getenv("WORLD_FORMAT", snapshot.JSON)).lower()
+        if self.world_format not in snapshot.FORMATS:
+            msg = f"Unknown world format: {self.world_format}"
+            raise ValueError(msg)
+        self.snapshot_path = self.world_path.with_suffix(".moo")
+        # changes saved since the snapshot, one JSON line per save
+        self.changes_path = self.world_path.with_name(f"{self.world_path.stem}.changes.jsonl")
         self.bots_dir = Path(bots_dir)
 
         # Ensure bots directory exists
@@ -34,35 +60,67 @@ class LocalFileStorage(StorageInterface):
 
     def save_world(self, world) -> bool:
         try:
-            logger.debug("Saving world to local file: %s", self.world_path)
+            if self.world_format == snapshot.BINARY:
+                logger.debug("Saving world snapshot to local file: %s", self.snapshot_path)
+                write_atomically(self.snapshot_path, snapshot.dumps(world))
+            else:
+                logger.debug("Saving world to local file: %s", self.world_path)
+                data = json.dumps(
+                    world,
+                    default=lambda o: o.json_dictionary(),
+                    sort_keys=True,
+                    indent=2,
+                    separators=(",", ": "),
+                )
+                write_atomically(self.world_path, data)
+            # the snapshot now includes every saved change
+            self.changes_path.unlink(missing_ok=True)
+            logger.info("World saved successfully to local file")
+        except Exception:
+            logger.exception("Failed to save world to local file")
+            return False
+        else:
+            return True
+
+    def save_changes(self, world, changed: dict[str, dict], deleted: list[str]) -> bool:
+        try:
+            logger.debug("Saving %d world changes to local file: %s", len(changed) + len(deleted), self.changes_path)
             data = json.dumps(
-                world,
-                default=lambda o: o.json_dictionary(),
+                {"generation": world.generation, "changed": changed, "deleted": deleted},
                 sort_keys=True,
-                indent=2,
-                separators=(",", ": "),
+                separators=(",", ":"),
             )
-            with self.world_path.open("w") as f:
-                f.write(data)
-            logger.info("World saved successfully to local file")
+            with self.changes_path.open("a") as f:
+                f.write(data + "\n")
+            logger.info("World changes saved successfully to local file")
         except Exception:
-            logger.exception("Failed to save world to local file")
+            logger.exception("Failed to save world changes to local file")
             return False
         else:
             return True
 
     def load_world(self) -> dict | None:
         try:
-            logger.debug("Loading world from local file: %s", self.world_path)
-            if not self.world_path.exists():
-                logger.warning("World file does not exist: %s", self.world_path)
-                return None
-            with self.world_path.open() as f:
-                data = f.read()
-            if not data:
-                logger.warning("World file is empty: %s", self.world_path)
-                return None
-            world_data = json.loads(data)
+            if self.world_format == snapshot.BINARY and self.snapshot_path.exists():
+                logger.debug("Loading world from local snapshot: %s", self.snapshot_path)
+                world_data = snapshot.load(self.snapshot_path)
+            else:
+                logger.debug("Loading world from local file: %s", self.world_path)
+                if not self.world_path.exists():
+                    logger.warning("World file does not exist: %s", self.world_path)
+                    return None
+                with self.world_path.open() as f:
+                    data = f.read()
+                if not data:
+                    logger.warning("World file is empty: %s", self.world_path)
+                    return None
+                world_data = json.loads(data)
+            contents = world_data.setdefault("contents", {})
+            for id, record in self.load_changes(world_data.get("generation")).items():
+                if record is None:
+                    contents.pop(id, None)
+                else:
+                    contents[id] = record
             logger.info("World loaded successfully from local file")
         except Exception:
             logger.exception("Failed to load world from local file")
@@ -70,6 +128,61 @@ class LocalFileStorage(StorageInterface):
         else:
             return world_data
 
+    def stream_world(self) -> tuple[int | None, Iterator[dict]] | None:
+        try:
+            if self.world_format == snapshot.BINARY and self.snapshot_path.exists():
+                logger.debug("Streaming world from local snapshot: %s", self.snapshot_path)
+                generation, records = snapshot.stream(self.snapshot_path)
+            else:
+                logger.debug("Streaming world from local file: %s", self.world_path)
+                if not self.world_path.exists():
+                    logger.warning("World file does not exist: %s", self.world_path)
+                    return None
+                if not self.world_path.stat().st_size:
+                    logger.warning("World file is empty: %s", self.world_path)
+                    return None
+                generation = read_generation(self.world_path)
+                records = self.read_records()
+            changes = self.load_changes(generation)
+        except Exception:
+            logger.exception("Failed to stream world from local file")
+            return None
+        else:
+            return generation, overlay(records, changes)
+
+    def read_records(self) -> Iterator[dict]:
+        with self.world_path.open() as f:
+            yield from iter_records(f)
+
+    def load_changes(self, generation: int | None) -> dict[str, dict | None]:
+        """Load the changes saved since the snapshot.
+
+        Args:
+            generation: Generation of the snapshot the changes must have been saved against
+
+        Returns:
+            Changed records by id, with None for objects since removed
+        """
+        changes = {}
+        if not self.changes_path.exists():
+            return changes
+        applied = 0
+        with self.changes_path.open() as f:
+            for line in f:
+                try:
+                    change = json.loads(line)
+                except json.JSONDecodeError:
+                    # a save interrupted part way through
+                    logger.warning("Ignoring incomplete world change in %s", self.changes_path)
+                    break
+                if change.get("generation") != generation:
+                    continue
+                changes.update(change["changed"])
+                changes.update(dict.fromkeys(change["deleted"]))
+                applied += 1
+        logger.debug("Loaded %d world change sets from %s", applied, self.changes_path)
+        return changes
+
     def save_ai_history(self, player_name: str, history: list[dict]) -> bool:
         try:
             history_path = self.bots_dir / f"{player_name}.json"
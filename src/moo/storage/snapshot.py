@@ -0,0 +1,255 @@
+"""
+Compact binary world snapshots for MonkaMOO.
+
+A snapshot holds the same records as world.json in a columnar layout: every
+string is stored once in a string table, objects refer to each other by their
+index instead of their id, and each column is an array of little-endian
+32-bit integers that loads at C speed. A versioned header comes first.
+
+Convert between formats with:
+    python -m src.moo.storage.snapshot world.json world.moo
+    python -m src.moo.storage.snapshot world.moo world.json
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Iterator
+from itertools import accumulate
+from pathlib import Path
+
+# world formats storage can be configured with (WORLD_FORMAT)
+JSON = "json"
+BINARY = "binary"
+FORMATS = (JSON, BINARY)
+
+MAGIC = b"MOOW"
+VERSION = 1
+
+# magic, version, flags, generation, strings, string bytes, objects, exits
+HEADER = struct.Struct("<4sHHQIIII")
+
+# column value for a missing string or reference
+NONE = 0xFFFFFFFF
+# marks a reference to an id that isn't an object in the snapshot; the rest is a string index
+DANGLING = 0x80000000
+
+# record fields stored in columns; any others are kept as JSON in the extra column
+FIELDS = ("type", "id", "name", "description", "location", "exits")
+
+
+def dumps(world) -> bytes:
+    """Encode a world, a snapshot of one, or world data loaded from JSON.
+
+    Args:
+        world: Object with json_dictionary(), or a dictionary with "contents"
+
+    Returns:
+        The encoded snapshot
+    """
+    data = world.json_dictionary() if hasattr(world, "json_dictionary") else world
+    records = [
+        obj.json_dictionary() if hasattr(obj, "json_dictionary") else obj for obj in data.get("contents", {}).values()
+    ]
+    index = {record["id"]: i for i, record in enumerate(records)}
+    strings = {}
+
+    def intern(value):
+        if value is None:
+            return NONE
+        number = strings.get(value)
+        if number is None:
+            number = strings[value] = len(strings)
+        return number
+
+    def reference(id):
+        if id is None:
+            return NONE
+        number = index.get(id)
+        return number if number is not None else DANGLING | intern(id)
+
+    types, ids, names, descriptions, locations, exit_counts, extras = (array("I") for _ in range(7))
+    exit_names, exit_targets = array("I"), array("I")
+    for record in records:
+        types.append(intern(record["type"]))
+        ids.append(intern(record["id"]))
+        names.append(intern(record.get("name")))
+        descriptions.append(intern(record.get("description")))
+        locations.append(reference(record.get("location")))
+        exits = record.get("exits")
+        if exits is None:
+            exit_counts.append(NONE)
+        else:
+            exit_counts.append(len(exits))
+            for direction, target in exits.items():
+                exit_names.append(intern(direction))
+                exit_targets.append(reference(target))
+        extra = {key: value for key, value in record.items() if key not in FIELDS}
+        extras.append(intern(json.dumps(extra, sort_keys=True)) if extra else NONE)
+
+    offsets = array("I", accumulate(map(len, strings), initial=0))
+    text = "".join(strings).encode("utf-8")
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        0,
+        data.get("generation") or 0,
+        len(strings),
+        len(text),
+        len(records),
+        len(exit_names),
+    )
+    parts = [header, offsets, text, b"\0" * (-len(text) % 4)]
+    parts += [types, ids, names, descriptions, locations, exit_counts, extras, exit_names, exit_targets]
+    if sys.byteorder == "big":
+        for part in parts:
+            if isinstance(part, array):
+                part.byteswap()
+    return b"".join(bytes(part) for part in parts)
+
+
+def decode(buffer) -> tuple[int, Iterator[dict]]:
+    """Decode a snapshot's header and columns, leaving its records to be built as they are read.
+
+    The buffer isn't used once this returns.
+
+    Args:
+        buffer: Bytes, or any buffer such as an mmap, holding the snapshot
+
+    Returns:
+        The world's generation and an iterator over its object records
+
+    Raises:
+        ValueError: If the buffer isn't a snapshot this version can read
+    """
+    with memoryview(buffer) as view:
+        if len(view) < HEADER.size:
+            msg = "World snapshot is truncated"
+            raise ValueError(msg)
+        magic, version, _flags, generation, string_count, text_size, object_count, exit_count = HEADER.unpack_from(
+            view,
+        )
+        if magic != MAGIC:
+            msg = "Not a MonkaMOO world snapshot"
+            raise ValueError(msg)
+        if version != VERSION:
+            msg = f"Unsupported world snapshot version: {version}"
+            raise ValueError(msg)
+        position = HEADER.size
+
+        def column(count):
+            nonlocal position
+            values = array("I")
+            values.frombytes(view[position : position + count * 4])
+            if sys.byteorder == "big":
+                values.byteswap()
+            position += count * 4
+            return values.tolist()
+
+        offsets = column(string_count + 1)
+        text = str(view[position : position + text_size], "utf-8")
+        position += text_size + (-text_size % 4)
+        strings = [text[start:end] for start, end in zip(offsets[:-1], offsets[1:], strict=True)]
+        types, ids, names, descriptions, locations, exit_counts, extras = (column(object_count) for _ in range(7))
+        exit_names, exit_targets = column(exit_count), column(exit_count)
+
+    ids = [strings[number] for number in ids]
+
+    def dereference(number):
+        if number == NONE:
+            return None
+        if number & DANGLING:
+            return strings[number & ~DANGLING]
+        return ids[number]
+
+    # resolve whole columns at once, leaving the loop below to build the records
+    types = [strings[number] for number in types]
+    names = [None if number == NONE else strings[number] for number in names]
+    descriptions = [None if number == NONE else strings[number] for number in descriptions]
+    locations = [None if number == NONE else dereference(number) for number in locations]
+    exit_names = [strings[number] for number in exit_names]
+    exit_targets = [dereference(number) for number in exit_targets]
+
+    def records():
+        cursor = 0
+        for id, type, name, description, location, count, extra in zip(
+            ids,
+            types,
+            names,
+            descriptions,
+            locations,
+            exit_counts,
+            extras,
+            strict=True,
+        ):
+            record = {"type": type, "id": id, "name": name, "description": description, "location": location}
+            if count != NONE:
+                end = cursor + count
+                record["exits"] = dict(zip(exit_names[cursor:end], exit_targets[cursor:end], strict=True))
+                cursor = end
+            if extra != NONE:
+                record.update(json.loads(strings[extra]))
+            yield record
+
+    return generation, records()
+
+
+def loads(buffer) -> dict:
+    """Decode a snapshot into world data, as it would be loaded from world.json.
+
+    Args:
+        buffer: Bytes, or any buffer such as an mmap, holding the snapshot
+
+    Returns:
+        World data dictionary
+    """
+    generation, records = decode(buffer)
+    return {"contents": {record["id"]: record for record in records}, "generation": generation}
+
+
+def stream(path) -> tuple[int, Iterator[dict]]:
+    """Decode the snapshot in a file, mapping it into memory rather than reading it.
+
+    Args:
+        path: Path of the snapshot file
+
+    Returns:
+        The world's generation and an iterator over its object records
+    """
+    with Path(path).open("rb") as f:
+        if not f.seek(0, 2):
+            msg = "World snapshot is empty"
+            raise ValueError(msg)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return decode(buffer)
+
+
+def load(path) -> dict:
+    """Decode the snapshot in a file into world data.
+
+    Args:
+        path: Path of the snapshot file
+
+    Returns:
+        World data dictionary
+    """
+    generation, records = stream(path)
+    return {"contents": {record["id"]: record for record in records}, "generation": generation}
+
+
+def convert(source, destination):
+    """Convert a world between JSON and a binary snapshot, going by the file suffixes."""
+    source, destination = Path(source), Path(destination)
+    world_data = json.loads(source.read_text()) if source.suffix == ".json" else load(source)
+    if destination.suffix == ".json":
+        destination.write_text(json.dumps(world_data, sort_keys=True, indent=2, separators=(",", ": ")))
+    else:
+        destination.write_bytes(dumps(world_data))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("Usage: python -m src.moo.storage.snapshot SOURCE DESTINATION")
+    convert(sys.argv[1], sys.argv[2])
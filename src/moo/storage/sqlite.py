@@ -0,0 +1,276 @@
+"""
+SQLite storage implementation for MonkaMOO.
+
+Stores each object in its own row, so saves can update just the objects that
+changed and loads can read a subset of the world.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from ..logging_config import get_logger
+from .interface import IncrementalStorage, IndexedStorage, StorageInterface
+from .local import LocalFileStorage
+
+# Get logger for this module
+logger = get_logger("monkamoo.storage.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    location TEXT,
+    name TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS objects_location ON objects (location);
+CREATE INDEX IF NOT EXISTS objects_type ON objects (type);
+CREATE INDEX IF NOT EXISTS objects_name ON objects (name);
+CREATE TABLE IF NOT EXISTS ai_history (
+    player_name TEXT PRIMARY KEY,
+    history TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+INSERT = "INSERT INTO objects (id, type, location, name, data) VALUES (?, ?, ?, ?, ?)"
+UPSERT = (
+    f"{INSERT} "
+    "ON CONFLICT (id) DO UPDATE SET "
+    "type = excluded.type, location = excluded.location, name = excluded.name, data = excluded.data"
+)
+
+# ids bound to one query, below SQLite's limit on variables
+BATCH = 500
+
+
+def fold(name: str | None) -> str | None:
+    # names are matched ignoring case, as Base.lookup() does
+    return name.casefold() if name else None
+
+
+def row(record: dict) -> tuple:
+    data = json.dumps(record, separators=(",", ":"))
+    return record["id"], record["type"], record.get("location"), fold(record.get("name")), data
+
+
+def batched(values: list, size: int = BATCH) -> Iterator[list]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+class SQLiteStorage(IncrementalStorage, IndexedStorage):
+    """SQLite database storage implementation, with one row per object."""
+
+    in_place = True
+
+    def __init__(self, db_path: str | None = None, world_path: str = "world.json", bots_dir: str = "bots"):
+        """Initialize SQLite storage.
+
+        A new database is seeded from the local world file and AI player
+        histories, if there are any, so switching to SQLite keeps the world.
+
+        Args:
+            db_path: Path to the database (defaults to environment variable,
+                then world_path with a .db suffix)
+            world_path: Path to world state file the database stands in for
+            bots_dir: Directory of AI player history files to import with it
+        """
+        self.db_path = Path(db_path or os.getenv("SQLITE_PATH") or Path(world_path).with_suffix(".db"))
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # saves run on a worker thread, so the connection is shared behind a lock
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        # with WAL, commits survive a crash of the process; NORMAL only risks the last ones on power loss
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        # room for the indexes of a large world, which saves otherwise spend their time paging through
+        self.connection.execute("PRAGMA cache_size = -65536")
+        self.connection.executescript(SCHEMA)
+        if not self.has_world() and Path(world_path).exists():
+            self.import_from(LocalFileStorage(world_path=world_path, bots_dir=bots_dir))
+
+        logger.info("SQLiteStorage initialized: db=%s", self.db_path)
+
+    def import_from(self, storage: StorageInterface) -> bool:
+        """Copy the world and AI player histories saved in other storage into the database."""
+        logger.info("Importing world into database: %s", self.db_path)
+        world_data = storage.load_world()
+        if world_data is None or not self.save_world(world_data):
+            return False
+        for player_name in storage.list_ai_players():
+            history = storage.load_ai_history(player_name)
+            if history is not None:
+                self.save_ai_history(player_name, history)
+        logger.info("Imported %d objects into database", len(world_data.get("contents", {})))
+        return True
+
+    def transaction(self, statements):
+        """Run statements, a function of a cursor, in one transaction."""
+        with self.lock:
+            cursor = self.connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                statements(cursor)
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+
+    def query(self, sql: str, parameters: Iterable = ()) -> list[tuple]:
+        with self.lock:
+            return self.connection.execute(sql, tuple(parameters)).fetchall()
+
+    def save_world(self, world) -> bool:
+        try:
+            data = world.json_dictionary() if hasattr(world, "json_dictionary") else world
+            records = [
+                obj.json_dictionary() if hasattr(obj, "json_dictionary") else obj for obj in data["contents"].values()
+            ]
+            logger.debug("Saving %d objects to database: %s", len(records), self.db_path)
+
+            def statements(cursor):
+                cursor.execute("DELETE FROM objects")
+                cursor.executemany(INSERT, map(row, records))
+                cursor.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('generation', ?)",
+                    (data.get("generation"),),
+                )
+
+            self.transaction(statements)
+            logger.info("World saved successfully to database")
+        except Exception:
+            logger.exception("Failed to save world to database")
+            return False
+        else:
+            return True
+
+    def save_changes(self, _world, changed: dict[str, dict], deleted: list[str]) -> bool:
+        try:
+            logger.debug("Saving %d world changes to database: %s", len(changed) + len(deleted), self.db_path)
+
+            def statements(cursor):
+                cursor.executemany(UPSERT, map(row, changed.values()))
+                cursor.executemany("DELETE FROM objects WHERE id = ?", ((id,) for id in deleted))
+
+            self.transaction(statements)
+            logger.info("World changes saved successfully to database")
+        except Exception:
+            logger.exception("Failed to save world changes to database")
+            return False
+        else:
+            return True
+
+    def has_world(self) -> bool:
+        return self.generation() is not None or bool(self.query("SELECT 1 FROM objects LIMIT 1"))
+
+    def generation(self) -> int | None:
+        rows = self.query("SELECT value FROM meta WHERE key = 'generation'")
+        return int(rows[0][0]) if rows and rows[0][0] is not None else None
+
+    def load_world(self) -> dict | None:
+        stream = self.stream_world()
+        if stream is None:
+            return None
+        generation, records = stream
+        return {"contents": {record["id"]: record for record in records}, "generation": generation}
+
+    def stream_world(self) -> tuple[int | None, Iterator[dict]] | None:
+        try:
+            logger.debug("Loading world from database: %s", self.db_path)
+            if not self.has_world():
+                logger.warning("No world saved in database: %s", self.db_path)
+                return None
+            generation = self.generation()
+            records = self.read_records()
+            logger.info("World loaded successfully from database")
+        except Exception:
+            logger.exception("Failed to load world from database")
+            return None
+        else:
+            return generation, records
+
+    def read_records(self) -> Iterator[dict]:
+        # a connection of its own, so saves can go on while the world is read
+        connection = sqlite3.connect(self.db_path)
+        try:
+            for (data,) in connection.execute("SELECT data FROM objects"):
+                yield json.loads(data)
+        finally:
+            connection.close()
+
+    def load_objects(
+        self,
+        ids: Iterable[str] | None = None,
+        locations: Iterable[str] | None = None,
+        types: Iterable[str] | None = None,
+        names: Iterable[str] | None = None,
+    ) -> dict[str, dict]:
+        records = {}
+        names = [fold(name) for name in names or ()]
+        for column, values in (("id", ids), ("location", locations), ("type", types), ("name", names)):
+            for batch in batched(list(values or ())):
+                placeholders = ", ".join("?" * len(batch))
+                for (data,) in self.query(f"SELECT data FROM objects WHERE {column} IN ({placeholders})", batch):
+                    record = json.loads(data)
+                    records[record["id"]] = record
+        return records
+
+    def save_ai_history(self, player_name: str, history: list[dict]) -> bool:
+        try:
+            logger.debug("Saving AI history for %s to database", player_name)
+            data = json.dumps(history, separators=(",", ":"))
+            self.transaction(
+                lambda cursor: cursor.execute(
+                    "INSERT OR REPLACE INTO ai_history (player_name, history) VALUES (?, ?)",
+                    (player_name, data),
+                ),
+            )
+            logger.debug("AI history saved successfully for %s", player_name)
+        except Exception:
+            logger.exception("Failed to save AI history for %s", player_name)
+            return False
+        else:
+            return True
+
+    def load_ai_history(self, player_name: str) -> list[dict] | None:
+        try:
+            logger.debug("Loading AI history for %s from database", player_name)
+            rows = self.query("SELECT history FROM ai_history WHERE player_name = ?", (player_name,))
+            if not rows:
+                logger.debug("AI history does not exist for %s", player_name)
+                return None
+            history = json.loads(rows[0][0])
+            logger.debug("AI history loaded successfully for %s", player_name)
+        except Exception:
+            logger.exception("Failed to load AI history for %s", player_name)
+            return None
+        else:
+            return history
+
+    def list_ai_players(self) -> list[str]:
+        try:
+            players = [name for (name,) in self.query("SELECT player_name FROM ai_history ORDER BY player_name")]
+            logger.debug("Found %d AI players in database", len(players))
+        except Exception:
+            logger.exception("Failed to list AI players")
+            return []
+        else:
+            return players
+
+    def health_check(self) -> bool:
+        try:
+            self.query("SELECT 1")
+            logger.debug("SQLite storage health check passed")
+        except Exception:
+            logger.exception("SQLite storage health check failed")
+            return False
+        else:
+            return True
@@ -0,0 +1,160 @@
+"""
+Streaming world loading for MonkaMOO.
+
+Reads the objects of a world.json file one at a time, so a world can be
+rebuilt without holding the whole parsed file in memory at once.
+"""
+
+import json
+import re
+
+# whitespace JSON allows between tokens
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# a member's key and the colon after it, when the key has no escapes
+KEY = re.compile(r'[ \t\n\r]*"([^"\\]*)"[ \t\n\r]*:')
+# the comma or brace after a member
+SEPARATOR = re.compile(r"[ \t\n\r]*([,}])")
+
+GENERATION = re.compile(r'"generation":\s*(-?\d+)\s*}\s*$')
+
+decoder = json.JSONDecoder()
+
+
+class JSONStream:
+    """Incremental reader of JSON values from a text file."""
+
+    def __init__(self, file, chunk_size=1 << 16):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+
+    def read(self):
+        """Read another chunk, dropping what has already been parsed."""
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.position :] + chunk
+        self.position = 0
+        return True
+
+    def peek(self):
+        """Skip whitespace and return the next character, or "" at the end."""
+        while True:
+            self.position = WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.read():
+                return ""
+
+    def expect(self, characters):
+        character = self.peek()
+        if not character or character not in characters:
+            msg = f"Expected {characters!r} at offset {self.position}, found {character!r}"
+            raise ValueError(msg)
+        self.position += 1
+        return character
+
+    def value(self):
+        """Parse the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if self.read():
+                    continue
+                raise
+            # a number at the end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and not self.eof and self.read():
+                continue
+            self.position = end
+            return value
+
+    def key(self):
+        """Parse a member's key and the colon after it."""
+        match = KEY.match(self.buffer, self.position)
+        if match:
+            self.position = match.end()
+            return match.group(1)
+        key = self.value()
+        self.expect(":")
+        return key
+
+    def separator(self):
+        """Parse the comma or brace after a member, returning True at the end of the object."""
+        match = SEPARATOR.match(self.buffer, self.position)
+        if match:
+            self.position = match.end()
+            return match.group(1) == "}"
+        return self.expect(",}") == "}"
+
+    def values(self):
+        """Yield the value of each member of the object that comes next, skipping the keys."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.position += 1
+            return
+        while True:
+            self.key()
+            yield self.value()
+            if self.separator():
+                return
+
+
+def iter_records(file):
+    """Yield the object records in a world.json file, one at a time.
+
+    Args:
+        file: Text file positioned at the start of the world data
+    """
+    stream = JSONStream(file)
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        if stream.key() == "contents":
+            yield from stream.values()
+        else:
+            stream.value()
+        if stream.separator():
+            return
+
+
+def read_generation(path):
+    """Return the generation of a world.json file without parsing all of it.
+
+    Keys are saved sorted, so "generation" is the last member of the file.
+    """
+    with path.open("rb") as f:
+        size = f.seek(0, 2)
+        f.seek(max(0, size - 256))
+        match = GENERATION.search(f.read().decode("utf-8", "replace"))
+    return int(match.group(1)) if match else None
+
+
+def overlay(records, changes):
+    """Yield records with later changes applied.
+
+    Args:
+        records: Object records, such as a snapshot's
+        changes: Changed records by id, with None for objects since removed
+
+    Yields:
+        Each record, or the change replacing it, then the records of objects
+        that were added
+    """
+    changes = dict(changes)
+    for record in records:
+        if record["id"] in changes:
+            change = changes.pop(record["id"])
+            if change is not None:
+                yield change
+        else:
+            yield record
+    for record in changes.values():
+        if record is not None:
+            yield record
@@ -0,0 +1,136 @@
+import asyncio
+import math
+import os
+
+from .logging_config import get_logger
+
+# Get logger for this module
+logger = get_logger("monkamoo.timers")
+
+
+class Timer:
+    """A pending call on a TimingWheel; cancel() stops it from running."""
+
+    __slots__ = ("args", "cancelled", "deadline", "function", "kwargs", "wheel")
+
+    def __init__(self, wheel, deadline, function, args, kwargs):
+        self.wheel = wheel
+        self.deadline = deadline
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.cancelled = False
+
+    def __repr__(self):
+        return f"<Timer {getattr(self.function, '__qualname__', self.function)} tick={self.deadline}>"
+
+    def cancel(self):
+        if not self.cancelled:
+            self.cancelled = True
+            self.wheel.count -= 1
+
+    def when(self):
+        """Return the event-loop time the timer is due."""
+        return self.wheel.start + self.deadline * self.wheel.tick
+
+
+class TimingWheel:
+    """A hierarchical timing wheel driven by a single task.
+
+    Time advances in ticks of `tick` seconds (TIMER_TICK). Level 0 has a slot per
+    tick for the next `slots` ticks; each higher level covers `slots` times the
+    span of the one below, and its slots are cascaded down as time reaches them.
+    Scheduling and cancelling are O(1), and the driver only sleeps while timers
+    are pending.
+    """
+
+    def __init__(self, tick=None, slots=64, levels=4):
+        self.tick = tick if tick is not None else float(os.getenv("TIMER_TICK", "0.1"))
+        self.slots = slots
+        self.levels = [[[] for _ in range(slots)] for _ in range(levels)]
+        # timers further out than the top level can reach
+        self.overflow = []
+        self.current = 0
+        self.count = 0
+        self.start = None
+        self.task = None
+        self.wakeup = None
+
+    def __len__(self):
+        return self.count
+
+    def schedule(self, delay, function, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        if self.start is None:
+            self.start = loop.time()
+            self.wakeup = asyncio.Event()
+        now = loop.time()
+        if not self.count:
+            # nothing pending, so the wheel can jump straight to the current tick
+            self.current = max(self.current, math.floor((now - self.start) / self.tick))
+        ticks = max(1, math.ceil((now + delay - self.start) / self.tick) - self.current)
+        timer = Timer(self, self.current + ticks, function, args, kwargs)
+        self.insert(timer)
+        self.count += 1
+        if self.task is None or self.task.done():
+            self.task = loop.create_task(self.run())
+        self.wakeup.set()
+        return timer
+
+    def insert(self, timer):
+        delta = timer.deadline - self.current
+        span = 1
+        for wheel in self.levels:
+            if delta < span * self.slots:
+                wheel[(timer.deadline // span) % self.slots].append(timer)
+                return
+            span *= self.slots
+        self.overflow.append(timer)
+
+    def pending(self):
+        """Return the live timers, soonest first."""
+        timers = [timer for wheel in self.levels for slot in wheel for timer in slot]
+        timers.extend(self.overflow)
+        return sorted((timer for timer in timers if not timer.cancelled), key=lambda timer: timer.deadline)
+
+    def advance(self):
+        """Move to the next tick, cascading higher levels down, and run what is due."""
+        self.current += 1
+        span = 1
+        for level, wheel in enumerate(self.levels[1:], 1):
+            span *= self.slots
+            if self.current % span:
+                break
+            slot = wheel[(self.current // span) % self.slots]
+            wheel[(self.current // span) % self.slots] = []
+            for timer in slot:
+                if not timer.cancelled:
+                    self.insert(timer)
+            if level == len(self.levels) - 1:
+                overflow, self.overflow = self.overflow, []
+                for timer in overflow:
+                    if not timer.cancelled:
+                        self.insert(timer)
+        index = self.current % self.slots
+        due = self.levels[0][index]
+        self.levels[0][index] = []
+        for timer in due:
+            if timer.cancelled:
+                continue
+            timer.cancelled = True
+            self.count -= 1
+            try:
+                timer.function(*timer.args, **timer.kwargs)
+            except Exception:
+                logger.exception("Timer %r failed", timer)
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self.count:
+                self.wakeup.clear()
+                await self.wakeup.wait()
+                continue
+            await asyncio.sleep(max(0, self.start + (self.current + 1) * self.tick - loop.time()))
+            while self.count and self.start + (self.current + 1) * self.tick <= loop.time():
+                self.advance()
@@ -0,0 +1,24 @@
+import io
+
+import pytest
+
+from src.moo.core.player import Player
+from src.moo.core.world import World
+
+
+@pytest.fixture
+def world(tmp_path, monkeypatch):
+    """An empty world saved to local storage in a temporary directory."""
+    monkeypatch.setenv("STORAGE_TYPE", "local")
+    monkeypatch.setenv("WORLD_JOURNAL", "false")
+    monkeypatch.delenv("WORLD_LAZY", raising=False)
+    return World(path=str(tmp_path / "world.json"))
+
+
+@pytest.fixture
+def player(world):
+    """A player in the world's first room, whose output is kept in player.stdout."""
+    player = Player(name="tester")
+    player.stdout = io.StringIO()
+    world.add_player(player)
+    return player
@@ -0,0 +1,54 @@
+import asyncio
+import time
+from unittest import mock
+
+import pytest
+
+from src.moo.core.room import Room
+from src.moo.storage import CloudStorage
+
+LATENCY = 0.2
+# how often the player sends a command
+INTERVAL = 0.01
+
+
+class FakeS3:
+    """Just enough of an S3 client for CloudStorage saves, with a delay on every request."""
+
+    def __init__(self):
+        self.objects = {}
+
+    def put_object(self, Bucket, Key, Body, **_kwargs):  # noqa: N803
+        time.sleep(LATENCY)
+        self.objects[Bucket, Key] = Body
+
+
+async def walk(world, player, until):
+    """Walk back and forth between two rooms until the save is done, returning the slowest command."""
+    slowest = 0.0
+    direction = "north"
+    while not until.done():
+        start = time.perf_counter()
+        world.parse_command(player, f"go {direction}")
+        direction = "south" if direction == "north" else "north"
+        await asyncio.sleep(INTERVAL)
+        slowest = max(slowest, time.perf_counter() - start - INTERVAL)
+    return slowest
+
+
+@pytest.mark.asyncio
+async def test_commands_run_while_the_world_is_saved(world, player):
+    s3 = FakeS3()
+    with mock.patch("boto3.client", return_value=s3):
+        world.storage = CloudStorage(bucket_name="monkamoo")
+    north = Room(name="North", exits={"south": "0"})
+    world.add(north)
+    world.contents["0"].exits["north"] = north.id
+
+    saving = world.request_save()
+    slowest = await walk(world, player, saving)
+    await saving
+
+    assert world.save_stats["saves"] == 1
+    assert s3.objects
+    assert slowest < LATENCY / 4
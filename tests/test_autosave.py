@@ -0,0 +1,34 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from src.moo.core.room import Room
+
+
+@pytest.mark.asyncio
+async def test_autosave_tries_again_after_a_failed_save(world, monkeypatch):
+    attempts = []
+    save_world = world.storage.save_world
+
+    def fail_once(snapshot):
+        attempts.append(snapshot)
+        return len(attempts) > 1 and save_world(snapshot)
+
+    monkeypatch.setattr(world.storage, "save_world", fail_once)
+    world.autosave_interval = 0.01
+    world.add(Room(name="Attic"))
+    world.start_autosave()
+
+    async def saved():
+        while world.save_stats["saves"] < 1:
+            await asyncio.sleep(0.01)
+
+    try:
+        await asyncio.wait_for(saved(), 1)
+    finally:
+        world.autosaver.cancel()
+
+    assert world.save_stats["failed"] == 1
+    assert len(attempts) == 2
+    assert "Attic" in Path(world.path).read_text()
@@ -0,0 +1,50 @@
+import pytest
+
+from src.moo.line_parser import Parser
+
+# (line, verb, direct object, preposition, indirect object, indirect args)
+# as parsed by the word-at-a-time parser the preposition trie replaced
+SINGLE_WORD = [
+    ("look", "look", None, None, None, None),
+    ("look me", "look", "me", None, None, None),
+    ("look at sky", "look", None, "at", "sky", "sky"),
+    ("look at", "look", None, "at", None, None),
+    ("take ball", "take", "ball", None, None, None),
+    ("take ball at", "take", "ball", "at", None, None),
+    ("take the ball.", "take", "ball", None, None, None),
+    ("look under rock", "look", None, "under", "rock", "rock"),
+    ("hide ball under sand", "hide", "ball", "under", "sand", "sand"),
+    ("put yellow bird in cuckoo clock", "put", "yellow bird", "into", "cuckoo clock", "cuckoo clock"),
+    ("describe here as A room in the MOO.", "describe", "here", "as", "room in MOO", "A room in the MOO."),
+]
+
+# prepositions of more than one word, which the old parser split apart
+MULTI_WORD = [
+    ("put box in front of the door", "put", "box", "in_front", "door", "the door"),
+    ("put lamp on top of table", "put", "lamp", "onto", "table", "table"),
+    ("take book out of the chest", "take", "book", "from", "chest", "the chest"),
+    ("take key from inside box", "take", "key", "from", "box", "box"),
+    ("jump off of roof", "jump", None, "off", "roof", "roof"),
+    ("put box In Front Of door", "put", "box", "in_front", "door", "door"),
+    ("name glass as Cup", "name", "glass", "as", "Cup", "Cup"),
+]
+
+CASES = [(line, tuple(expected)) for line, *expected in SINGLE_WORD + MULTI_WORD]
+
+
+@pytest.mark.parametrize(("line", "expected"), CASES)
+def test_parse(line, expected):
+    command = Parser.parse(line)
+    parsed = (
+        command.verb,
+        command.direct_object_str,
+        command.preposition,
+        command.indirect_object_str,
+        command.indirect_args,
+    )
+    assert parsed == expected
+
+
+@pytest.mark.parametrize("line", ["", "the", "a an the"])
+def test_parse_nothing(line):
+    assert Parser.parse(line) is None
@@ -0,0 +1,33 @@
+import json
+
+from src.moo.core.room import Room
+from src.moo.core.world import World
+from src.moo.storage import SQLiteStorage
+
+
+def test_new_database_imports_the_local_world(tmp_path):
+    lobby = {"type": "Room", "id": "0", "name": "Lobby"}
+    world_path = tmp_path / "world.json"
+    world_path.write_text(json.dumps({"contents": {"0": lobby}, "generation": 3}))
+    bots = tmp_path / "bots"
+    bots.mkdir()
+    (bots / "bot.json").write_text(json.dumps([{"role": "user", "content": "hello"}]))
+
+    storage = SQLiteStorage(world_path=str(world_path), bots_dir=str(bots))
+    assert storage.load_world() == {"contents": {"0": lobby}, "generation": 3}
+    assert storage.load_ai_history("bot") == [{"role": "user", "content": "hello"}]
+
+
+def test_first_save_after_loading_only_writes_changes(world, monkeypatch):
+    world.storage = SQLiteStorage(world_path=world.path)
+    world.save()
+
+    loaded = World(path=world.path)
+    loaded.storage = world.storage
+    loaded.load()
+    monkeypatch.setattr(loaded.storage, "save_world", lambda _world: False)
+    attic = Room(name="Attic")
+    loaded.add(attic)
+    loaded.save(compact=True)
+    assert loaded.save_stats["saves"] == 1
+    assert loaded.storage.load_objects(ids=[attic.id])
@@ -0,0 +1,22 @@
+import pytest
+
+from src.moo.core.ball import Ball
+
+
+@pytest.mark.parametrize(
+    "verb",
+    ["touch", "attach", "detach", "category", "index", "unindex", "rename", "lookup", "verbs", "reset_verbs"],
+)
+def test_internal_methods_are_not_verbs(world, player, verb):
+    ball = Ball(name="ball")
+    world.contents["0"].add(ball)
+    world.parse_command(player, f"{verb} ball")
+    assert player.stdout.getvalue() == "I didn't understand that.\n"
+
+
+def test_verbs_still_resolve(world, player):
+    ball = Ball(name="ball")
+    world.contents["0"].add(ball)
+    world.parse_command(player, "take ball")
+    assert player.stdout.getvalue() == "You take ball.\n"
+    assert ball.location is player
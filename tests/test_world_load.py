@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from src.moo.core.room import Room
+from src.moo.core.world import World
+
+
+def test_failed_load_keeps_the_world_and_the_saved_file(world):
+    for i in range(50):
+        world.add(Room(id=f"room{i}", name=f"Room {i}"))
+    world.save()
+    path = Path(world.path)
+    # one corrupt record part way through the file
+    corrupt = path.read_text().replace('"id": "room40"', '"id": room40', 1)
+    path.write_text(corrupt)
+
+    loaded = World(path=world.path)
+    loaded.load()
+    assert list(loaded.contents) == ["0"]
+    assert loaded.load_failed
+
+    loaded.add(Room(name="Attic"))
+    loaded.save()
+    assert path.read_text() == corrupt
+
+
+def test_load_replaces_the_world(world):
+    attic = Room(name="Attic")
+    world.add(attic)
+    world.save()
+
+    loaded = World(path=world.path)
+    loaded.load()
+    assert loaded.find_room("attic").id == attic.id
+    assert loaded.contents[attic.id].world is loaded
+    assert not loaded.changed
@@ -0,0 +1,49 @@
+from src.moo.core.room import Room
+from src.moo.storage import StorageInterface
+
+
+class WholeWorldStorage(StorageInterface):
+    """Storage that can only save the whole world, keeping each save."""
+
+    def __init__(self):
+        self.saves = []
+
+    def save_world(self, world):
+        self.saves.append(world.json_dictionary())
+        return True
+
+    def load_world(self):
+        return self.saves[-1] if self.saves else None
+
+    def save_ai_history(self, _player_name, _history):
+        return True
+
+    def load_ai_history(self, _player_name):
+        return None
+
+    def list_ai_players(self):
+        return []
+
+    def health_check(self):
+        return True
+
+
+def test_unchanged_world_is_not_saved_again(world):
+    world.storage = WholeWorldStorage()
+    world.save()
+    world.save()
+    assert len(world.storage.saves) == 1
+
+    world.add(Room(name="Attic"))
+    world.save()
+    assert len(world.storage.saves) == 2
+
+
+def test_world_is_saved_again_after_a_failed_save(world):
+    world.storage = WholeWorldStorage()
+    world.add(Room(name="Attic"))
+    world.storage.save_world = lambda _world: False
+    world.save()
+    del world.storage.save_world
+    world.save()
+    assert len(world.storage.saves) == 1